@@ -21,6 +21,10 @@ from pathlib import Path
 from typing import Optional
 
 
+# Folder holding this script (and startup.py), resolved once at import
+_SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
 def get_config_dir() -> Path:
     """Get the configuration directory path."""
     return Path.home() / ".nuke" / "hiero_review_projects"
@@ -28,10 +32,15 @@ def get_config_dir() -> Path:
 
 def list_available_projects() -> list:
     """List all available project configurations."""
-    config_dir = get_config_dir()
-    if not config_dir.exists():
+    # scandir entries carry their file type, so no extra stat per file
+    try:
+        with os.scandir(get_config_dir()) as entries:
+            return [
+                entry.name[:-5] for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return [f.stem for f in config_dir.glob("*.json")]
 
 
 def load_project_config(project_name: str) -> dict:
@@ -48,8 +57,9 @@ def load_project_config(project_name: str) -> dict:
                 f"Please create a config file at: {config_dir}"
             )
 
-    with open(config_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # json.loads decodes the UTF-8 bytes itself; skips the text-mode wrapper
+    with open(config_file, 'rb') as f:
+        return json.loads(f.read())
 
 
 def setup_environment(config: dict) -> None:
@@ -68,8 +78,7 @@ def setup_environment(config: dict) -> None:
     os.environ['HIERO_COLOR_SPACE'] = settings.get('color_space', 'ACES')
     
     # Set plugin path for Hiero to find our tools
-    scripts_dir = Path(__file__).parent
-    plugins_dir = scripts_dir.parent / 'plugins'
+    plugins_dir = _SCRIPTS_DIR.parent / 'plugins'
     os.environ['HIERO_PLUGIN_PATH'] = str(plugins_dir)
 
 
@@ -121,7 +130,7 @@ def get_nuke_executable() -> str:
 def launch_hiero(config: dict, mode: str = 'hiero') -> None:
     """Launch Hiero (via Nuke --hiero) with the startup script."""
     nuke_exe = get_nuke_executable()
-    startup_script = Path(__file__).parent / 'startup.py'
+    startup_script = _SCRIPTS_DIR / 'startup.py'
 
     # Build command: Nuke16.0.exe --hiero [--python startup.py]
     cmd = [nuke_exe, f'--{mode}']
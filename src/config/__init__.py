@@ -5,6 +5,7 @@ Configuration module for Hiero Review Tool.
 from .project_config import (
     ProjectConfig,
     load_project_config,
+    load_project_configs,
     save_project_config,
     get_config_dir,
     list_available_projects,
@@ -22,6 +23,7 @@ __all__ = [
     # Project config
     'ProjectConfig',
     'load_project_config',
+    'load_project_configs',
     'save_project_config',
     'get_config_dir',
     'list_available_projects',
@@ -4,7 +4,10 @@ Project Configuration Module
 Handles loading, validation, and management of project configurations.
 """
 import os
+import re
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
@@ -16,23 +19,41 @@ from ..models.models import (
     CacheSettings,
 )
 
+# Parse config files with orjson when it is installed. Either parser takes
+# the raw bytes, so files are read in binary and never go through a text layer.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class ConfigValidationError(Exception):
     """Raised when configuration validation fails."""
     pass
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get the configuration directory path."""
+    """
+    Get the configuration directory path.
+    
+    Resolved once; every config list, load and save goes through here.
+    """
     return Path.home() / ".nuke" / "hiero_review_projects"
 
 
 def list_available_projects() -> List[str]:
     """List all available project configurations."""
-    config_dir = get_config_dir()
-    if not config_dir.exists():
+    # scandir entries carry their file type, so no extra stat per file
+    try:
+        with os.scandir(get_config_dir()) as entries:
+            return [
+                entry.name[:-5] for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return [f.stem for f in config_dir.glob("*.json")]
 
 
 def validate_config(data: Dict[str, Any]) -> List[str]:
@@ -68,7 +89,6 @@ def validate_config(data: Dict[str, Any]) -> List[str]:
     
     # Naming patterns validation (check regex validity)
     naming = data.get('naming', {})
-    import re
     for key in ['episode_regex', 'sequence_regex', 'shot_regex', 'version_regex']:
         pattern = naming.get(key)
         if pattern:
@@ -92,23 +112,30 @@ def load_project_config(project_name: str) -> ProjectConfig:
         
     Raises:
         FileNotFoundError: If config file not found
-        ConfigValidationError: If config validation fails
-        json.JSONDecodeError: If JSON is invalid
+        ConfigValidationError: If config validation fails or the file is not a JSON object
+        json.JSONDecodeError: If JSON is invalid (orjson's error subclasses it)
     """
     config_dir = get_config_dir()
-    config_file = config_dir / f"{project_name}.json"
     
-    if not config_file.exists():
-        # Try default config
-        config_file = config_dir / "default.json"
-        if not config_file.exists():
-            raise FileNotFoundError(
-                f"Project config '{project_name}' not found and no default.json exists.\n"
-                f"Please create a config file at: {config_dir}"
-            )
+    # Open directly instead of probing with exists() first; a missing
+    # file costs one failed open either way
+    for config_file in (config_dir / f"{project_name}.json", config_dir / "default.json"):
+        try:
+            with open(config_file, 'rb') as f:
+                data = _json_loads(f.read())
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        raise FileNotFoundError(
+            f"Project config '{project_name}' not found and no default.json exists.\n"
+            f"Please create a config file at: {config_dir}"
+        )
     
-    with open(config_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ConfigValidationError(
+            f"Configuration must be a JSON object, not {type(data).__name__}"
+        )
     
     # Validate configuration
     errors = validate_config(data)
@@ -120,6 +147,44 @@ def load_project_config(project_name: str) -> ProjectConfig:
     return ProjectConfig.from_dict(data)
 
 
+def load_project_configs(
+    project_names: Optional[List[str]] = None, max_workers: int = 8
+) -> Dict[str, ProjectConfig]:
+    """
+    Load several project configurations concurrently.
+    
+    Config folders often live on network home directories, so the file
+    reads are overlapped on a thread pool. Configs that fail to load or
+    validate are reported and left out.
+    
+    Args:
+        project_names: Projects to load (default: all available)
+        max_workers: Maximum number of concurrent reads
+        
+    Returns:
+        Dict of {project_name: ProjectConfig} in the order given
+    """
+    if project_names is None:
+        project_names = list_available_projects()
+    if not project_names:
+        return {}
+    
+    def load_one(name: str) -> Optional[ProjectConfig]:
+        try:
+            return load_project_config(name)
+        except (OSError, ValueError, TypeError, KeyError, AttributeError,
+                ConfigValidationError) as e:
+            print(f"[ProjectConfig] Skipping '{name}': {e}")
+            return None
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(project_names))) as executor:
+        loaded = executor.map(load_one, project_names)
+        return {
+            name: config for name, config in zip(project_names, loaded)
+            if config is not None
+        }
+
+
 def save_project_config(config: ProjectConfig, project_name: Optional[str] = None) -> Path:
     """
     Save project configuration to JSON file.
@@ -3,14 +3,14 @@ Core business logic for Hiero Review Tool.
 """
 
 from .cache_manager import CacheManager, CacheEntry
-from .file_scanner import ProjectScanner, MOV_EXTENSIONS, IMAGE_EXTENSIONS
+from .file_scanner import ProjectScanner, FastScanner, MOV_EXTENSIONS, IMAGE_EXTENSIONS
 from .version_manager import VersionManager
 from .hiero_wrapper import (
     HieroProject, HieroTimeline, HieroClip, HieroTrackItem,
     HIERO_AVAILABLE,
 )
 from .timeline_builder import TimelineBuilder, TimelineConfig, BuildResult
-from .version_updater import VersionUpdater, UpdateResult
+from .version_updater import VersionUpdater, UpdateResult, Change
 from .department_switcher import DepartmentSwitcher, SwitchResult
 from .audio_sync import AudioSynchronizer, SyncResult
 from .sequence_handler import SequenceHandler, SequenceInfo
@@ -21,6 +21,7 @@ __all__ = [
     'CacheEntry',
     # Scanner
     'ProjectScanner',
+    'FastScanner',
     'MOV_EXTENSIONS',
     'IMAGE_EXTENSIONS',
     # Version
@@ -38,6 +39,7 @@ __all__ = [
     # Version updater
     'VersionUpdater',
     'UpdateResult',
+    'Change',
     # Department
     'DepartmentSwitcher',
     'SwitchResult',
@@ -16,7 +16,7 @@ from ..utils.path_parser import extract_episode, extract_sequence, extract_shot
 AUDIO_EXTENSIONS = {'.wav', '.mp3', '.aac', '.aiff', '.flac'}
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioMatch:
     """Represents an audio file matched to a video shot."""
     video_shot: str
@@ -13,7 +13,7 @@ from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Represents a cache entry with data and metadata."""
     data: Any
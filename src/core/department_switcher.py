@@ -4,14 +4,25 @@ Department Switcher Module
 Switch all shots in a timeline to a different department output.
 """
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Any, Callable, Set
 from dataclasses import dataclass, field
 
-from .hiero_wrapper import HieroClip, HieroTrackItem, HIERO_AVAILABLE
+from .hiero_wrapper import HieroClip, HieroTrackItem
 from .file_scanner import ProjectScanner
 from .version_manager import VersionManager
 
 
+@lru_cache(maxsize=1024)
+def _department_from_path(path: str, departments: tuple) -> Optional[str]:
+    """First department whose folder appears in path (memoized per path)."""
+    path_lower = path.lower()
+    for dept in departments:
+        if f'/{dept}/' in path_lower:
+            return dept
+    return None
+
+
 @dataclass
 class SwitchResult:
     """Result of department switch operation."""
@@ -51,20 +62,14 @@ class DepartmentSwitcher:
     
     def get_current_department(self, track_item: Any) -> Optional[str]:
         """Extract current department from track item's media path."""
-        try:
-            if HIERO_AVAILABLE:
-                source = track_item.source()
-                path = source.mediaSource().fileinfos()[0].filename()
-            else:
-                path = track_item.clip._path if hasattr(track_item, 'clip') else ""
-            
-            path_lower = path.lower()
-            for dept in self.DEPARTMENTS:
-                if f'/{dept}/' in path_lower:
-                    return dept
-            return None
-        except Exception:
+        path = HieroTrackItem.get_source_path(track_item)
+        if not path:
             return None
+        return self.department_from_path(path)
+    
+    def department_from_path(self, path: str) -> Optional[str]:
+        """Extract the department from a media path; results are cached per path."""
+        return _department_from_path(path, tuple(self.DEPARTMENTS))
     
     def get_available_departments(self, track: Any) -> Set[str]:
         """Get all departments available across track items."""
@@ -129,11 +134,7 @@ class DepartmentSwitcher:
                     continue
                 
                 # Get current path
-                if HIERO_AVAILABLE:
-                    source = item.source()
-                    current_path = source.mediaSource().fileinfos()[0].filename()
-                else:
-                    current_path = item.clip._path if hasattr(item, 'clip') else ""
+                current_path = HieroTrackItem.get_source_path(item) or ""
                 
                 # Find new department media
                 new_path = self._find_department_media(current_path, new_department)
@@ -146,7 +147,10 @@ class DepartmentSwitcher:
                 new_clip = HieroClip.create_clip(new_path)
                 if HieroTrackItem.update_item_source(item, new_clip):
                     result.success_count += 1
-                    HieroTrackItem.set_metadata(item, "department", new_department)
+                    HieroTrackItem.set_metadata_batch(item, {
+                        "department": new_department,
+                        "media_path": new_path,
+                    })
                 else:
                     result.errors.append(f"Item {i}: Failed to update source")
                 
@@ -4,12 +4,14 @@ File Scanner Module
 Core file system scanning with parallel execution and caching.
 """
 import os
+import sys
 import time
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Iterator, Tuple, Protocol, runtime_checkable
 
 from .cache_manager import CacheManager
+from .version_manager import VersionManager
 from ..utils.path_parser import (
     parse_version_from_filename,
     parse_frame_number,
@@ -19,8 +21,56 @@ from ..models.models import ScanResult, ShotInfo, DepartmentInfo
 
 
 # Media file extensions
-MOV_EXTENSIONS = {'.mov', '.mp4', '.avi', '.mkv'}
-IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.exr', '.dpx', '.tiff', '.tif'}
+MOV_EXTENSIONS = frozenset({'.mov', '.mp4', '.avi', '.mkv'})
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.exr', '.dpx', '.tiff', '.tif'})
+
+@runtime_checkable
+class FastScanner(Protocol):
+    """
+    Scanner interface used by TimelineBuilder.
+    
+    Adds scan_shots_many so a builder can list the shots of every sequence
+    it needs in one call instead of one call per sequence.
+    """
+    
+    def scan_shots(self, episode: str, sequence: str, use_cache: bool = True) -> List[str]: ...
+    
+    def scan_shot_detail(self, episode: str, sequence: str, shot: str) -> Dict[str, Any]: ...
+    
+    def scan_shots_many(
+        self, episode: str, sequences: List[str], use_cache: bool = True
+    ) -> Dict[str, List[str]]: ...
+
+
+def folder_stamp(*paths: Any) -> Tuple[int, ...]:
+    """
+    Get the modification times of folders (0 for any that are missing).
+    
+    A folder's mtime changes when an entry is added, removed or renamed in
+    it, so comparing stamps tells whether a cached listing is still valid.
+    """
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+def department_stamp_paths(dept_path: str, latest: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    Get the folders a department scan reads, for use with folder_stamp().
+    
+    Covers the department folder, its output and version folders (new MOVs
+    or version folders) and, if given, the latest version folder (frames
+    added or removed there).
+    """
+    version_path = os.path.join(dept_path, "version")
+    paths = (dept_path, os.path.join(dept_path, "output"), version_path)
+    if latest:
+        paths += (os.path.join(version_path, latest),)
+    return paths
 
 
 class ProjectScanner:
@@ -50,6 +100,13 @@ class ProjectScanner:
         self._cache = cache_manager or CacheManager()
         self._max_workers = max_workers
         self._progress_callback = progress_callback
+        # (project root mtime, episodes) from the last real walk of the root
+        self._episodes_stamp: Optional[tuple] = None
+    
+    @property
+    def project_root(self) -> Path:
+        """Root directory being scanned."""
+        return self._project_root
     
     def _report_progress(self, message: str, current: int = 0, total: int = 0) -> None:
         """Report progress to callback if set."""
@@ -58,37 +115,85 @@ class ProjectScanner:
     
     def _list_dirs(self, path: Path) -> List[str]:
         """List subdirectories in a path."""
-        if not path.exists():
-            return []
+        # scandir reads the entry type from the directory listing, so there is
+        # no extra stat per child (and no separate exists() check)
         try:
-            return [d.name for d in path.iterdir() if d.is_dir()]
-        except PermissionError:
+            with os.scandir(path) as entries:
+                return [e.name for e in entries if e.is_dir()]
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
             return []
     
-    def _list_files(self, path: Path, extensions: set = None) -> List[str]:
+    def _list_files(self, path: Path, extensions: frozenset = None) -> List[str]:
         """List files in a path, optionally filtered by extensions."""
-        if not path.exists():
-            return []
         try:
-            files = [f.name for f in path.iterdir() if f.is_file()]
-            if extensions:
-                files = [f for f in files if Path(f).suffix.lower() in extensions]
-            return sorted(files)
-        except PermissionError:
+            with os.scandir(path) as entries:
+                files = [e.name for e in entries if e.is_file()]
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
             return []
+        if extensions:
+            files = [f for f in files if os.path.splitext(f)[1].lower() in extensions]
+        return sorted(files)
     
-    def scan_episodes(self) -> List[str]:
-        """Scan for episode directories."""
+    def _known_episodes(self) -> Tuple[Optional[List[str]], Optional[int]]:
+        """
+        Return the episode listing if it is still valid, plus the root's mtime.
+        
+        Once the cached listing expires, it is reused (and re-cached) while
+        the root's modification time is unchanged, i.e. no entry was added,
+        removed or renamed.
+        """
         cached = self._cache.get('episodes', str(self._project_root))
         if cached:
-            return cached
-        
-        episodes = [d for d in self._list_dirs(self._project_root) if d.lower().startswith('ep')]
-        episodes.sort()
+            return cached, None
         
+        try:
+            mtime = os.stat(self._project_root).st_mtime_ns
+        except OSError:
+            mtime = None
+        stamp = self._episodes_stamp
+        if mtime is not None and stamp is not None and stamp[0] == mtime:
+            self._cache.set(stamp[1], 'episodes', str(self._project_root))
+            return stamp[1], mtime
+        return None, mtime
+    
+    def _store_episodes(self, episodes: List[str], mtime: Optional[int]) -> None:
+        """Cache a sorted episode listing taken at root mtime."""
+        self._episodes_stamp = (mtime, episodes)
         self._cache.set(episodes, 'episodes', str(self._project_root))
+    
+    def scan_episodes(self) -> List[str]:
+        """Scan for episode directories."""
+        episodes, mtime = self._known_episodes()
+        if episodes is None:
+            episodes = [d for d in self._list_dirs(self._project_root) if d.lower().startswith('ep')]
+            episodes.sort()
+            self._store_episodes(episodes, mtime)
         return episodes
     
+    def iter_episodes(self) -> Iterator[str]:
+        """
+        Yield episode directories as they are found, in listing order.
+        
+        Lets a UI show episodes progressively on slow storage. A complete
+        walk caches the sorted listing just like scan_episodes().
+        """
+        episodes, mtime = self._known_episodes()
+        if episodes is not None:
+            yield from episodes
+            return
+        
+        found = []
+        try:
+            with os.scandir(self._project_root) as entries:
+                for entry in entries:
+                    if entry.is_dir() and entry.name.lower().startswith('ep'):
+                        found.append(entry.name)
+                        yield entry.name
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            pass
+        found.sort()
+        self._store_episodes(found, mtime)
+    
     def scan_sequences(self, episode: str) -> List[str]:
         """Scan for sequence directories in an episode."""
         cached = self._cache.get('sequences', str(self._project_root), episode)
@@ -102,9 +207,15 @@ class ProjectScanner:
         self._cache.set(sequences, 'sequences', str(self._project_root), episode)
         return sequences
     
-    def scan_shots(self, episode: str, sequence: str) -> List[str]:
-        """Scan for shot directories in a sequence."""
-        cached = self._cache.get('shots', str(self._project_root), episode, sequence)
+    def scan_shots(self, episode: str, sequence: str, use_cache: bool = True) -> List[str]:
+        """
+        Scan for shot directories in a sequence.
+        
+        Args:
+            use_cache: Read the cached listing if there is one; pass False to
+                force a rescan (the fresh result is still cached)
+        """
+        cached = self._cache.get('shots', str(self._project_root), episode, sequence) if use_cache else None
         if cached:
             return cached
         
@@ -115,9 +226,38 @@ class ProjectScanner:
         self._cache.set(shots, 'shots', str(self._project_root), episode, sequence)
         return shots
     
-    def scan_departments(self, episode: str, sequence: str, shot: str) -> List[str]:
-        """Scan for department directories in a shot."""
-        cached = self._cache.get('depts', str(self._project_root), episode, sequence, shot)
+    def scan_shots_many(
+        self, episode: str, sequences: List[str], use_cache: bool = True
+    ) -> Dict[str, List[str]]:
+        """
+        Scan shot directories for several sequences at once.
+        
+        Sequence directories are listed in parallel. use_cache is passed on
+        to scan_shots.
+        
+        Returns:
+            Dict of {sequence: [shot, ...]} in the order of sequences
+        """
+        if not sequences:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(sequences))) as executor:
+            shot_lists = executor.map(lambda seq: self.scan_shots(episode, seq, use_cache), sequences)
+            return dict(zip(sequences, shot_lists))
+    
+    def scan_departments(
+        self, episode: str, sequence: str, shot: str, use_cache: bool = True
+    ) -> List[str]:
+        """
+        Scan for department directories in a shot.
+        
+        Args:
+            use_cache: Read the cached listing if there is one; pass False to
+                force a rescan (the fresh result is still cached)
+        """
+        cached = (
+            self._cache.get('depts', str(self._project_root), episode, sequence, shot)
+            if use_cache else None
+        )
         if cached:
             return cached
         
@@ -127,15 +267,41 @@ class ProjectScanner:
         self._cache.set(departments, 'depts', str(self._project_root), episode, sequence, shot)
         return departments
     
-    def scan_versions(self, episode: str, sequence: str, shot: str, dept: str) -> List[str]:
-        """Scan for version directories in a department."""
-        cached = self._cache.get('versions', str(self._project_root), episode, sequence, shot, dept)
-        if cached:
-            return cached
+    def scan_versions(
+        self,
+        episode: str,
+        sequence: str,
+        shot: str,
+        dept: str,
+        sort_versions: bool = True,
+        use_cache: bool = True
+    ) -> List[str]:
+        """
+        Scan for version directories in a department.
         
-        # Look in output and version subdirectories
-        dept_path = self._project_root / episode / sequence / shot / dept
-        versions = set()
+        Args:
+            sort_versions: Return versions in natural numeric order (v2 before v10).
+                When False, versions are returned in scan order.
+            use_cache: Read the cached listing if there is one. Callers that
+                track folder changes themselves pass False to force a rescan;
+                the fresh result is still cached.
+        """
+        versions = (
+            self._cache.get('versions', str(self._project_root), episode, sequence, shot, dept)
+            if use_cache else None
+        )
+        if not versions:
+            versions = self._scan_versions(self._project_root / episode / sequence / shot / dept)
+            self._cache.set(versions, 'versions', str(self._project_root), episode, sequence, shot, dept)
+        
+        if sort_versions:
+            return VersionManager.sort_versions(versions)
+        return list(versions)
+    
+    def _scan_versions(self, dept_path: Path) -> List[str]:
+        """Collect unique version names from a department in scan order."""
+        # dict keeps insertion order while de-duplicating
+        versions: Dict[str, None] = {}
         
         # Check output folder for MOV files
         output_path = dept_path / "output"
@@ -143,18 +309,16 @@ class ProjectScanner:
             for f in self._list_files(output_path, MOV_EXTENSIONS):
                 ver = parse_version_from_filename(f)
                 if ver:
-                    versions.add(ver)
+                    versions[ver] = None
         
         # Check version folder for subfolders
         version_path = dept_path / "version"
         if version_path.exists():
             for d in self._list_dirs(version_path):
                 if d.lower().startswith('v'):
-                    versions.add(d)
+                    versions[sys.intern(d)] = None
         
-        result = sorted(list(versions))
-        self._cache.set(result, 'versions', str(self._project_root), episode, sequence, shot, dept)
-        return result
+        return list(versions)
 
     def get_media_files(
         self, episode: str, sequence: str, shot: str, dept: str, version: str
@@ -163,17 +327,26 @@ class ProjectScanner:
         Get media files for a specific version.
 
         Returns:
-            Dict with 'mov_files', 'sequence_files', 'frame_range'
+            Dict with 'mov_files' (MOVs of this version), 'mov_by_version'
+            (first MOV of every version in the output folder),
+            'sequence_files' and 'frame_range' (of this version's folder)
         """
         dept_path = self._project_root / episode / sequence / shot / dept
-        result = {'mov_files': [], 'sequence_files': [], 'frame_range': None}
+        result = {'mov_files': [], 'mov_by_version': {}, 'sequence_files': [], 'frame_range': None}
 
         # Check output folder for MOV
         output_path = dept_path / "output"
         if output_path.exists():
+            mov_by_version = result['mov_by_version']
             for f in self._list_files(output_path, MOV_EXTENSIONS):
+                mov_path = str(output_path / f)
                 if version in f:
-                    result['mov_files'].append(str(output_path / f))
+                    result['mov_files'].append(mov_path)
+                # Key with the same parser scan_versions uses so lookups by
+                # a listed version always hit; first file wins
+                ver = parse_version_from_filename(f)
+                if ver:
+                    mov_by_version.setdefault(ver, mov_path)
 
         # Check version folder for sequences
         version_path = dept_path / "version" / version
@@ -198,6 +371,7 @@ class ProjectScanner:
                     'versions': versions,
                     'current_version': latest,
                     'mov_files': media['mov_files'],
+                    'mov_by_version': media['mov_by_version'],
                     'sequence_files': media['sequence_files'],
                     'frame_range': media['frame_range'],
                     'has_mov': len(media['mov_files']) > 0,
@@ -264,4 +438,5 @@ class ProjectScanner:
     def invalidate_cache(self) -> None:
         """Clear all cached scan results."""
         self._cache.clear()
+        self._episodes_stamp = None
 
@@ -4,7 +4,9 @@ Hiero API Wrapper Module
 Abstraction layer for Hiero API operations.
 Provides simplified interface and mock support for testing.
 """
-from typing import Optional, List, Any, Tuple
+import weakref
+from contextlib import contextmanager
+from typing import Optional, List, Any, Tuple, Dict, Iterator
 from dataclasses import dataclass
 
 # Try to import Hiero, fall back to mock if not available
@@ -12,11 +14,18 @@ try:
     import hiero.core
     import hiero.ui
     HIERO_AVAILABLE = True
+    # Bind frequently used classes once instead of walking hiero.core per call
+    _Bin = hiero.core.Bin
+    _BinItem = hiero.core.BinItem
+    _Clip = hiero.core.Clip
+    _MediaSource = hiero.core.MediaSource
+    _Sequence = hiero.core.Sequence
+    _Tag = hiero.core.Tag
 except ImportError:
     HIERO_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ClipInfo:
     """Information about a clip."""
     path: str
@@ -29,6 +38,9 @@ class ClipInfo:
 class HieroProject:
     """Wrapper for Hiero project operations."""
     
+    # Stands in for the active project outside Hiero, so mock sequences persist
+    _mock_project: Optional['MockProject'] = None
+    
     @staticmethod
     def create_project(name: str) -> Any:
         """Create a new Hiero project."""
@@ -42,10 +54,17 @@ class HieroProject:
     def get_active_project() -> Any:
         """Get the currently active project."""
         if not HIERO_AVAILABLE:
-            return MockProject("MockProject")
+            if HieroProject._mock_project is None:
+                HieroProject._mock_project = MockProject("MockProject")
+            return HieroProject._mock_project
         projects = hiero.core.projects()
         return projects[0] if projects else None
     
+    @staticmethod
+    def reset_mock_project() -> None:
+        """Forget the mock active project, and the sequences in it (no-op in Hiero)."""
+        HieroProject._mock_project = None
+    
     @staticmethod
     def create_bin(name: str, parent: Any = None) -> Any:
         """Create a bin in the project."""
@@ -54,65 +73,279 @@ class HieroProject:
         project = parent or HieroProject.get_active_project()
         if project:
             clips_bin = project.clipsBin()
-            return clips_bin.addItem(hiero.core.Bin(name))
+            return clips_bin.addItem(_Bin(name))
+        return None
+    
+    @staticmethod
+    def get_or_create_bin(path: str, project: Any = None) -> Any:
+        """
+        Find a bin by path, creating any missing level.
+        
+        Args:
+            path: Bin names from the clips bin down, separated by "/"
+                (e.g. "Ep01/sq0010"); a plain name is a top-level bin
+            project: Project to search (default: active project)
+        """
+        if not HIERO_AVAILABLE:
+            return MockBin(path.rsplit('/', 1)[-1])
+        project = project or HieroProject.get_active_project()
+        if not project:
+            return None
+        parent = project.clipsBin()
+        for name in path.split('/'):
+            parent = HieroProject._child_bin(parent, name) or parent.addItem(_Bin(name))
+        return parent
+    
+    @staticmethod
+    def find_bin(path: str, project: Any = None) -> Any:
+        """Find a bin by "/"-separated path without creating it, or None."""
+        if not HIERO_AVAILABLE:
+            return None
+        project = project or HieroProject.get_active_project()
+        if not project:
+            return None
+        parent = project.clipsBin()
+        for name in path.split('/'):
+            parent = HieroProject._child_bin(parent, name)
+            if parent is None:
+                return None
+        return parent
+    
+    @staticmethod
+    def _child_bin(parent: Any, name: str) -> Any:
+        """Get the direct sub-bin of parent with the given name, or None."""
+        for existing in parent.bins():
+            if existing.name() == name:
+                return existing
         return None
 
 
 class HieroTimeline:
     """Wrapper for Hiero timeline/sequence operations."""
     
+    # {project: {sequence_name: (bin_item, sequence)}}; hits are re-checked
+    # against the project, since sequences are renamed and deleted in Hiero
+    _SEQ_CACHE: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[Any, Any]]]" = weakref.WeakKeyDictionary()
+    
     @staticmethod
     def create_sequence(name: str, fps: float = 24.0) -> Any:
         """Create a new sequence."""
         if not HIERO_AVAILABLE:
-            return MockSequence(name, fps)
+            sequence = MockSequence(name, fps)
+            HieroProject.get_active_project().clipsBin().addItem(sequence)
+            return sequence
         project = HieroProject.get_active_project()
         if project:
-            sequence = hiero.core.Sequence(name)
+            sequence = _Sequence(name)
             sequence.setFramerate(fps)
-            project.clipsBin().addItem(hiero.core.BinItem(sequence))
+            project.clipsBin().addItem(_BinItem(sequence))
             return sequence
         return None
     
+    @staticmethod
+    @contextmanager
+    def batched_edit(sequence: Any, label: str = "HieroReview build timeline") -> Iterator[None]:
+        """
+        Group all edits to a sequence into a single undo step.
+        
+        Hiero refreshes its views per undo step, so grouping a build's
+        clip, track item and metadata edits avoids one refresh per edit.
+        Any object with a project() works in place of the sequence, e.g. a
+        track item.
+        """
+        if not HIERO_AVAILABLE:
+            yield
+            return
+        project = sequence.project()
+        project.beginUndo(label)
+        try:
+            yield
+        finally:
+            project.endUndo()
+    
     @staticmethod
     def add_video_track(sequence: Any, name: str = "Video") -> Any:
         """Add a video track to sequence."""
         if not HIERO_AVAILABLE:
-            return MockTrack(name, "video")
+            return _add_mock_track(sequence, MockTrack(name, "video"))
         return sequence.addTrack(hiero.core.VideoTrack(name))
     
     @staticmethod
     def add_audio_track(sequence: Any, name: str = "Audio") -> Any:
         """Add an audio track to sequence."""
         if not HIERO_AVAILABLE:
-            return MockTrack(name, "audio")
+            return _add_mock_track(sequence, MockTrack(name, "audio"))
         return sequence.addTrack(hiero.core.AudioTrack(name))
     
+    @staticmethod
+    def get_timeline_end(sequence: Any) -> int:
+        """Get the first free frame after the last item in the sequence."""
+        if HIERO_AVAILABLE:
+            try:
+                return sequence.duration()
+            except AttributeError:
+                pass
+        return max(
+            (item.timelineOut() + 1 for track in sequence.videoTracks() + sequence.audioTracks()
+             for item in track.items()),
+            default=0
+        )
+    
+    @staticmethod
+    def get_metadata(sequence: Any, key: str) -> Optional[str]:
+        """Get a metadata value from a sequence, or None if it is not set."""
+        # Sequences and track items share the same metadata API
+        return HieroTrackItem.get_metadata(sequence, key)
+    
+    @staticmethod
+    def set_metadata(sequence: Any, key: str, value: str) -> bool:
+        """Set metadata on a sequence."""
+        return HieroTrackItem.set_metadata(sequence, key, value)
+    
     @staticmethod
     def get_sequence_by_name(name: str) -> Any:
         """Find sequence by name in active project."""
-        if not HIERO_AVAILABLE:
-            return None
         project = HieroProject.get_active_project()
-        if project:
-            for item in project.clipsBin().items():
-                if hasattr(item, 'activeItem'):
-                    seq = item.activeItem()
-                    if isinstance(seq, hiero.core.Sequence) and seq.name() == name:
-                        return seq
-        return None
+        if not project:
+            return None
+        if not HIERO_AVAILABLE:
+            return next(
+                (item for item in project.clipsBin().items()
+                 if isinstance(item, MockSequence) and item.name() == name),
+                None
+            )
+        clips_bin = project.clipsBin()
+        try:
+            index = HieroTimeline._SEQ_CACHE.get(project)
+        except TypeError:  # Not weak-referenceable; just don't cache
+            index = None
+        entry = index.get(name) if index else None
+        if entry is not None and HieroTimeline._is_live_entry(entry, name, clips_bin):
+            return entry[1]
+        
+        # Missing, renamed or deleted: walk the bin once and re-index
+        index = {}
+        for item in clips_bin.items():
+            try:
+                seq = item.activeItem()
+            except AttributeError:
+                continue
+            if isinstance(seq, _Sequence):
+                index.setdefault(seq.name(), (item, seq))
+        try:
+            HieroTimeline._SEQ_CACHE[project] = index
+        except TypeError:
+            pass
+        entry = index.get(name)
+        return entry[1] if entry else None
+    
+    @staticmethod
+    def _is_live_entry(entry: Tuple[Any, Any], name: str, clips_bin: Any) -> bool:
+        """Check a cached sequence still has its name and is still in the clips bin."""
+        item, seq = entry
+        try:
+            return seq.name() == name and item.parentBin() == clips_bin
+        except (AttributeError, RuntimeError):  # Deleted underneath us
+            return False
 
 
 class HieroClip:
     """Wrapper for Hiero clip operations."""
     
     @staticmethod
-    def create_clip(media_path: str) -> Any:
-        """Create a clip from media file."""
+    def create_clip(media_path: str, target_bin: Any = None, color_space: Optional[str] = None) -> Any:
+        """
+        Create a clip from media file.
+        
+        Args:
+            media_path: Path to the media file
+            target_bin: Already-resolved bin to add the clip to (optional).
+                Resolve it once outside loops with HieroProject.get_or_create_bin.
+            color_space: Source colour transform to apply (optional)
+        """
         if not HIERO_AVAILABLE:
             return MockClip(media_path)
-        source = hiero.core.MediaSource(media_path)
-        return hiero.core.Clip(source)
+        clip = _Clip(_MediaSource(media_path))
+        if color_space:
+            clip.setSourceMediaColourTransform(color_space)
+        if target_bin is not None:
+            target_bin.addItem(_BinItem(clip))
+        return clip
+    
+    @staticmethod
+    def create_clips_batch(specs: List[Tuple[str, Optional[str], Optional[str]]]) -> List[Any]:
+        """
+        Create many clips inside a single undo group.
+        
+        Each bin is resolved once per batch rather than once per clip.
+        
+        Args:
+            specs: List of (media_path, bin_path, color_space) tuples.
+                bin_path is "/"-separated (see HieroProject.get_or_create_bin);
+                bin_path and color_space may be None.
+                
+        Returns:
+            List of clips in the same order as specs
+        """
+        if not HIERO_AVAILABLE:
+            return [MockClip(media_path) for media_path, _, _ in specs]
+        project = HieroProject.get_active_project()
+        if not project:
+            return []
+        
+        bins: Dict[str, Any] = {}
+        clips = []
+        project.beginUndo("HieroReview batch import")
+        try:
+            for media_path, bin_path, color_space in specs:
+                target_bin = None
+                if bin_path:
+                    target_bin = bins.get(bin_path)
+                    if target_bin is None:
+                        target_bin = HieroProject.get_or_create_bin(bin_path, project)
+                        bins[bin_path] = target_bin
+                clips.append(HieroClip.create_clip(media_path, target_bin, color_space))
+        finally:
+            project.endUndo()
+        return clips
+    
+    @staticmethod
+    def index_bin_clips(bin_paths: List[str], project: Any = None) -> Dict[Tuple[str, str], Any]:
+        """
+        Walk the given bins once and map their clips by source.
+        
+        Args:
+            bin_paths: "/"-separated paths of the bins to index, as passed to
+                HieroProject.get_or_create_bin; missing bins are skipped
+            project: Project to search (default: active project)
+            
+        Returns:
+            Dict of {(bin_path, media_path): clip}
+        """
+        if not HIERO_AVAILABLE:
+            return {}
+        project = project or HieroProject.get_active_project()
+        if not project:
+            return {}
+        
+        index = {}
+        for bin_path in bin_paths:
+            bin_ = HieroProject.find_bin(bin_path, project)
+            if bin_ is None:
+                continue
+            for item in bin_.items():
+                try:
+                    clip = item.activeItem()
+                except AttributeError:
+                    continue
+                if not isinstance(clip, _Clip):
+                    continue
+                try:
+                    media_path = clip.mediaSource().fileinfos()[0].filename()
+                except (IndexError, AttributeError):
+                    continue
+                index.setdefault((bin_path, media_path), clip)
+        return index
     
     @staticmethod
     def create_from_sequence(pattern: str, frame_range: Tuple[int, int]) -> Any:
@@ -120,8 +353,8 @@ class HieroClip:
         if not HIERO_AVAILABLE:
             return MockClip(pattern, frame_range)
         # Pattern like: /path/to/file.%04d.exr
-        source = hiero.core.MediaSource(pattern)
-        clip = hiero.core.Clip(source)
+        source = _MediaSource(pattern)
+        clip = _Clip(source)
         return clip
     
     @staticmethod
@@ -146,8 +379,74 @@ class HieroTrackItem:
     def add_item_to_track(track: Any, clip: Any, timeline_in: int, timeline_out: int) -> Any:
         """Add a clip to track at specified position."""
         if not HIERO_AVAILABLE:
-            return MockTrackItem(clip, timeline_in, timeline_out)
+            return _add_mock_item(track, clip, timeline_in, timeline_out)
         return track.addItem(clip, timeline_in)
+
+    @staticmethod
+    def add_av_pair(
+        video_track: Any,
+        audio_track: Any,
+        clip: Any,
+        timeline_in: int,
+        timeline_out: int
+    ) -> Tuple[Any, Any]:
+        """
+        Add a clip's video and audio to their tracks in one call.
+
+        Uses Sequence.addClip, which lays out linked A/V items together. If
+        the tracks cannot be resolved that way, falls back to one add per
+        track; that choice is made before anything is added, so a clip is
+        never laid out twice.
+
+        Returns:
+            Tuple of (video_item, audio_item); audio_item is None if
+            audio_track is None. Either may be None if addClip did not
+            produce an item on that track.
+        """
+        if audio_track is None:
+            return HieroTrackItem.add_item_to_track(video_track, clip, timeline_in, timeline_out), None
+        if not HIERO_AVAILABLE:
+            return (
+                _add_mock_item(video_track, clip, timeline_in, timeline_out),
+                _add_mock_item(audio_track, clip, timeline_in, timeline_out),
+            )
+        try:
+            sequence = video_track.parent()
+            add_clip = sequence.addClip
+            video_index = _track_index(sequence.videoTracks(), video_track)
+            audio_index = _track_index(sequence.audioTracks(), audio_track)
+        except (AttributeError, RuntimeError):
+            video_index = audio_index = None
+        if video_index is None or audio_index is None:
+            return video_track.addItem(clip, timeline_in), audio_track.addItem(clip, timeline_in)
+
+        items = add_clip(clip, timeline_in, video_index, audio_index) or ()
+        if not isinstance(items, (list, tuple)):
+            items = (items,)
+        video_item = audio_item = None
+        for item in items:
+            parent = item.parent()
+            if video_item is None and parent == video_track:
+                video_item = item
+            elif audio_item is None and parent == audio_track:
+                audio_item = item
+        # addClip's return value varies; find anything it didn't hand back
+        if video_item is None:
+            video_item = _item_at(video_track, timeline_in)
+        if audio_item is None:
+            audio_item = _item_at(audio_track, timeline_in)
+        return video_item, audio_item
+
+    @staticmethod
+    def get_source_path(item: Any) -> Optional[str]:
+        """Get the media file path behind a track item, or None if it has none."""
+        if not HIERO_AVAILABLE:
+            clip = getattr(item, 'clip', None)
+            return getattr(clip, '_path', None)
+        try:
+            return item.source().mediaSource().fileinfos()[0].filename()
+        except (IndexError, AttributeError, RuntimeError):  # RuntimeError: item already deleted
+            return None
     
     @staticmethod
     def update_item_source(item: Any, new_clip: Any) -> bool:
@@ -158,7 +457,7 @@ class HieroTrackItem:
         try:
             item.setSource(new_clip)
             return True
-        except Exception:
+        except (AttributeError, RuntimeError):
             return False
     
     @staticmethod
@@ -166,22 +465,74 @@ class HieroTrackItem:
         """Add a tag to track item."""
         if not HIERO_AVAILABLE:
             return MockTag(tag_name, color)
-        tag = hiero.core.Tag(tag_name)
+        tag = _Tag(tag_name)
         item.addTag(tag)
         return tag
     
+    @staticmethod
+    def get_metadata(item: Any, key: str) -> Optional[str]:
+        """Get a metadata value from track item, or None if it is not set."""
+        if not HIERO_AVAILABLE:
+            return getattr(item, '_metadata', {}).get(key)
+        try:
+            metadata = item.metadata()
+            return metadata.value(key) if metadata.hasKey(key) else None
+        except (AttributeError, RuntimeError):
+            return None
+    
     @staticmethod
     def set_metadata(item: Any, key: str, value: str) -> bool:
         """Set metadata on track item."""
         if not HIERO_AVAILABLE:
+            metadata = getattr(item, '_metadata', None)
+            if metadata is not None:
+                metadata[key] = value
             return True
         try:
             item.metadata().setValue(key, value)
             return True
-        except Exception:
+        except (AttributeError, RuntimeError):
+            return False
+    
+    @staticmethod
+    def set_metadata_batch(item: Any, values: Dict[str, str]) -> bool:
+        """Set several metadata keys on track item, fetching its metadata once."""
+        if not HIERO_AVAILABLE:
+            metadata = getattr(item, '_metadata', None)
+            if metadata is not None:
+                metadata.update(values)
+            return True
+        try:
+            metadata = item.metadata()
+            for key, value in values.items():
+                metadata.setValue(key, value)
+            return True
+        except (AttributeError, RuntimeError):
             return False
 
 
+def _track_index(tracks: List[Any], track: Any) -> Optional[int]:
+    """
+    Find a track's index by equality, then by name.
+    
+    Hiero hands out a new Python wrapper per call, so identity never matches.
+    """
+    for i, candidate in enumerate(tracks):
+        if candidate == track:
+            return i
+    name = track.name()
+    matches = [i for i, candidate in enumerate(tracks) if candidate.name() == name]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _item_at(track: Any, timeline_in: int) -> Any:
+    """Get the item starting at timeline_in on a track, or None (latest items first)."""
+    for item in reversed(track.items()):
+        if item.timelineIn() == timeline_in:
+            return item
+    return None
+
+
 # ============================================================================
 # Mock classes for testing outside Hiero
 # ============================================================================
@@ -227,6 +578,9 @@ class MockSequence:
         self._name = name
         self._fps = fps
         self._tracks = []
+        self._video_tracks = []
+        self._audio_tracks = []
+        self._metadata = {}
 
     def name(self) -> str:
         return self._name
@@ -239,13 +593,17 @@ class MockSequence:
 
     def addTrack(self, track: Any) -> Any:
         self._tracks.append(track)
+        if track.track_type == "video":
+            self._video_tracks.append(track)
+        elif track.track_type == "audio":
+            self._audio_tracks.append(track)
         return track
 
     def videoTracks(self) -> List[Any]:
-        return [t for t in self._tracks if t.track_type == "video"]
+        return list(self._video_tracks)
 
     def audioTracks(self) -> List[Any]:
-        return [t for t in self._tracks if t.track_type == "audio"]
+        return list(self._audio_tracks)
 
 
 class MockTrack:
@@ -301,6 +659,9 @@ class MockTrackItem:
         self._tags = []
         self._metadata = {}
 
+    def name(self) -> str:
+        return getattr(self.clip, '_path', '').rsplit('/', 1)[-1]
+
     def source(self) -> Any:
         return self.clip
 
@@ -320,6 +681,22 @@ class MockTrackItem:
         return self._tags
 
 
+def _add_mock_track(sequence: Any, track: 'MockTrack') -> 'MockTrack':
+    """Add a mock track to the sequence, if it is a mock sequence."""
+    if isinstance(sequence, MockSequence):
+        sequence.addTrack(track)
+    return track
+
+
+def _add_mock_item(track: Any, clip: Any, timeline_in: int, timeline_out: int) -> 'MockTrackItem':
+    """Create a mock track item and place it on the track, if it is a mock track."""
+    item = MockTrackItem(clip, timeline_in, timeline_out)
+    items = getattr(track, '_items', None)
+    if items is not None:
+        items.append(item)
+    return item
+
+
 class MockTag:
     """Mock Hiero tag for testing."""
     def __init__(self, name: str, color: str = "red"):
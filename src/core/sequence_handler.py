@@ -3,7 +3,9 @@ Image Sequence Handler Module
 ==============================
 Loading and managing image sequences (PNG, EXR, etc.) in timelines.
 """
+import os
 import re
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass, field
@@ -13,10 +15,58 @@ from ..utils.path_parser import parse_frame_number
 
 
 # Supported image formats
-IMAGE_FORMATS = {'.png', '.exr', '.jpg', '.jpeg', '.tif', '.tiff', '.dpx'}
+IMAGE_FORMATS = frozenset({'.png', '.exr', '.jpg', '.jpeg', '.tif', '.tiff', '.dpx'})
 
+# Extensions without the leading dot, for probing str.rpartition results
+_IMAGE_EXTS_NO_DOT = frozenset(e[1:] for e in IMAGE_FORMATS)
 
-@dataclass
+# Pattern to detect frame number in filename
+_FRAME_RE = re.compile(r'\.(\d{4,})\.(\w+)$')
+
+
+def _split_frame_name(name: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split "base.####.ext" into (base_name, digits, ext).
+    
+    Equivalent to _FRAME_RE restricted to IMAGE_FORMATS, without the regex
+    engine or a Match object per file. Returns None for non-frame names.
+    """
+    stem, dot, ext = name.rpartition('.')
+    if not dot:
+        return None
+    # Extensions are lowercase by convention; only fold case when needed
+    if ext not in _IMAGE_EXTS_NO_DOT and ext.lower() not in _IMAGE_EXTS_NO_DOT:
+        return None
+    base_name, dot, digits = stem.rpartition('.')
+    # isdecimal(), not isdigit(): superscripts like "²" are digits int() rejects
+    if not dot or len(digits) < 4 or not digits.isdecimal():
+        return None
+    return base_name, digits, ext
+
+
+def _is_regular_file(entry: os.DirEntry) -> bool:
+    """Check a scandir entry is a file, treating races (e.g. ENOENT) as not."""
+    try:
+        return entry.is_file(follow_symlinks=False)
+    except OSError:
+        return False
+
+
+def _find_missing_frames(frames: List[int]) -> List[int]:
+    """
+    Find gaps in a sorted list of frame numbers.
+    
+    Walks adjacent pairs, so memory is proportional to the number of
+    missing frames rather than the length of the frame range.
+    """
+    missing = []
+    for a, b in zip(frames, frames[1:]):
+        if b - a > 1:
+            missing.extend(range(a + 1, b))
+    return missing
+
+
+@dataclass(slots=True)
 class SequenceInfo:
     """Information about an image sequence."""
     pattern: str  # e.g., "file.####.png" or "file.%04d.png"
@@ -28,24 +78,22 @@ class SequenceInfo:
     frame_count: int
     missing_frames: List[int] = field(default_factory=list)
     padding: int = 4
+    # Full-path patterns, computed once in __post_init__
+    hiero_pattern: str = field(default="", init=False)  # Hiero format (####)
+    printf_pattern: str = field(default="", init=False)  # printf format (%04d)
+    
+    def __post_init__(self):
+        prefix = f"{self.directory}/{self.base_name}."
+        self.hiero_pattern = f"{prefix}{'#' * self.padding}{self.extension}"
+        self.printf_pattern = f"{prefix}%0{self.padding}d{self.extension}"
     
     @property
     def is_complete(self) -> bool:
         """Check if sequence has no missing frames."""
         return len(self.missing_frames) == 0
-    
-    @property
-    def hiero_pattern(self) -> str:
-        """Get pattern in Hiero format (####)."""
-        return f"{self.directory}/{self.base_name}.{'#' * self.padding}{self.extension}"
-    
-    @property
-    def printf_pattern(self) -> str:
-        """Get pattern in printf format (%04d)."""
-        return f"{self.directory}/{self.base_name}.%0{self.padding}d{self.extension}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of sequence validation."""
     is_valid: bool
@@ -60,7 +108,7 @@ class SequenceHandler:
     """
     
     # Pattern to detect frame number in filename
-    FRAME_PATTERN = re.compile(r'\.(\d{4,})\.(\w+)$')
+    FRAME_PATTERN = _FRAME_RE
     
     def __init__(self):
         """Initialize SequenceHandler."""
@@ -81,55 +129,38 @@ class SequenceHandler:
             return []
         
         # Group files by base name (without frame number)
-        sequences: Dict[str, List[Tuple[str, int]]] = {}
+        # {(base_name, ext): [(path, frame, padding), ...]}
+        sequences: Dict[Tuple[str, str], List[Tuple[str, int, int]]] = {}
         
-        for file_path in dir_path.iterdir():
-            if not file_path.is_file():
-                continue
-            if file_path.suffix.lower() not in IMAGE_FORMATS:
-                continue
-            
-            # Extract frame number
-            match = self.FRAME_PATTERN.search(file_path.name)
-            if not match:
-                continue
-            
-            frame_num = int(match.group(1))
-            ext = f".{match.group(2)}"
-            
-            # Get base name (everything before frame number)
-            base_name = file_path.name[:match.start()]
-            if base_name.endswith('.'):
-                base_name = base_name[:-1]
-            
-            key = f"{base_name}{ext}"
-            if key not in sequences:
-                sequences[key] = []
-            sequences[key].append((str(file_path), frame_num))
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Name check first so non-image entries never pay for a stat
+                parts = _split_frame_name(entry.name)
+                if parts is None or not _is_regular_file(entry):
+                    continue
+                
+                base_name, digits, ext = parts
+                sequences.setdefault((base_name, ext), []).append(
+                    (entry.path, int(digits), len(digits))
+                )
         
         # Build SequenceInfo for each detected sequence
         result = []
-        for key, files in sequences.items():
+        for (base_name, ext), files in sequences.items():
             if len(files) < 2:
                 continue  # Single file, not a sequence
             
-            files.sort(key=lambda x: x[1])
+            files.sort(key=itemgetter(1))
             frames = [f[1] for f in files]
             
-            # Detect padding from first file
-            first_file = Path(files[0][0]).name
-            match = self.FRAME_PATTERN.search(first_file)
-            padding = len(match.group(1)) if match else 4
+            # Padding was recorded at match time
+            padding = files[0][2]
             
-            # Find missing frames
-            start_frame, end_frame = min(frames), max(frames)
-            expected = set(range(start_frame, end_frame + 1))
-            actual = set(frames)
-            missing = sorted(expected - actual)
+            # Find missing frames; files are sorted, so the ends are the range
+            start_frame, end_frame = files[0][1], files[-1][1]
+            missing = _find_missing_frames(frames)
             
-            # Extract base name and extension
-            base_name = key.rsplit('.', 1)[0]
-            extension = f".{key.rsplit('.', 1)[1]}" if '.' in key else ""
+            extension = f".{ext}"
             
             result.append(SequenceInfo(
                 pattern=f"{base_name}.{'#' * padding}{extension}",
@@ -173,11 +204,7 @@ class SequenceHandler:
         """
         result = ValidationResult(is_valid=True)
         
-        frames = []
-        for f in files:
-            frame = parse_frame_number(f)
-            if frame is not None:
-                frames.append(frame)
+        frames = [fn for f in files if (fn := parse_frame_number(f)) is not None]
         
         if not frames:
             result.is_valid = False
@@ -188,10 +215,7 @@ class SequenceHandler:
         result.frame_count = len(frames)
         
         # Check for missing frames
-        start, end = frames[0], frames[-1]
-        expected = set(range(start, end + 1))
-        actual = set(frames)
-        result.missing_frames = sorted(expected - actual)
+        result.missing_frames = _find_missing_frames(frames)
         
         if result.missing_frames:
             result.errors.append(f"Missing {len(result.missing_frames)} frames")
@@ -200,8 +224,7 @@ class SequenceHandler:
     
     def get_frame_range(self, files: List[str]) -> Optional[Tuple[int, int]]:
         """Get frame range from list of files."""
-        frames = [parse_frame_number(f) for f in files]
-        frames = [f for f in frames if f is not None]
+        frames = [fn for f in files if (fn := parse_frame_number(f)) is not None]
         
         if frames:
             return (min(frames), max(frames))
@@ -209,11 +232,10 @@ class SequenceHandler:
     
     def detect_missing_frames(self, files: List[str]) -> List[int]:
         """Detect missing frames in a sequence."""
-        frames = [parse_frame_number(f) for f in files if parse_frame_number(f) is not None]
+        frames = [fn for f in files if (fn := parse_frame_number(f)) is not None]
         if len(frames) < 2:
             return []
         
-        start, end = min(frames), max(frames)
-        expected = set(range(start, end + 1))
-        return sorted(expected - set(frames))
+        frames.sort()
+        return _find_missing_frames(frames)
 
@@ -3,16 +3,43 @@ Timeline Builder Module
 ========================
 Main timeline construction logic for assembling shots into organized timelines.
 """
+import hashlib
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Callable, Any, Tuple
+from functools import partial
+from itertools import accumulate, chain, islice, tee
+from typing import List, Dict, Optional, Callable, Any, Tuple, Iterable, Iterator
 from pathlib import Path
 
-from .file_scanner import ProjectScanner
+from .file_scanner import ProjectScanner, FastScanner, department_stamp_paths, folder_stamp
 from .hiero_wrapper import HieroProject, HieroTimeline, HieroClip, HieroTrackItem
 from .version_manager import VersionManager
 
 
-@dataclass
+# First run of digits in a shot name (SH0010 -> 0010)
+_SHOT_NUM_RE = re.compile(r'(\d+)')
+
+# Minimum seconds between intermediate progress callbacks (~30 Hz)
+_PROGRESS_INTERVAL = 0.033
+
+# Clips imported per undo group while streaming a new timeline
+_CLIP_BATCH_SIZE = 32
+
+# Suffixes of movie files whose embedded audio is laid on the audio track
+_MOV_SUFFIXES = ('.mov', '.MOV', '.Mov')
+
+# Sequence metadata key holding the fingerprint of the last build applied to it
+_BUILD_HASH_KEY = "hiero_review.build_hash"
+
+# (shot_name, clip_path, version, duration, has_audio) for one scanned shot
+ClipData = Tuple[str, str, str, int, bool]
+
+
+@dataclass(slots=True)
 class TimelineConfig:
     """Configuration for timeline building."""
     name: str
@@ -23,9 +50,11 @@ class TimelineConfig:
     media_type: str = "mov"  # "mov" or "sequence"
     fps: float = 24.0
     include_audio: bool = True
+    update_existing: bool = False  # Update a same-named timeline in place
+    max_scan_workers: int = 16  # Threads used to scan shot folders
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelinePosition:
     """Timeline position for a clip."""
     shot_name: str
@@ -33,14 +62,19 @@ class TimelinePosition:
     timeline_in: int
     timeline_out: int
     duration: int
+    version: str = ""
+    has_audio: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildResult:
     """Result of timeline build operation."""
     success: bool
     sequence: Any = None
+    shots_found: int = 0
     shots_added: int = 0
+    shots_updated: int = 0  # Update mode: existing items switched to new media
+    shots_unchanged: int = 0  # Update mode: existing items already up to date
     shots_skipped: List[str] = None
     errors: List[str] = None
     
@@ -70,157 +104,623 @@ class TimelineBuilder:
         """
         self._scanner = scanner
         self._progress_callback = progress_callback
+        # Scanning runs on worker threads; keep callback messages from interleaving
+        self._progress_lock = threading.Lock()
+        self._last_progress_ts = 0.0
+        # Scan results reused across builds while the folders they came from
+        # are unchanged. {(ep, seq): (sequence folder mtime, sorted shots)}
+        self._shots_cache: Dict[Tuple[str, str], Tuple[Tuple[int, ...], List[str]]] = {}
+        # {(ep, seq, shot): (stamped folders, their mtimes or None, shot_data)}
+        self._detail_cache: Dict[
+            Tuple[str, str, str], Tuple[Tuple[str, ...], Optional[Tuple[int, ...]], Dict]
+        ] = {}
+        # {(bin_path, media_path): clip}, filled per bin as a build first touches it
+        self._bin_index: Dict[Tuple[str, str], Any] = {}
+        self._indexed_bins: set = set()
+        # {media_path: clip} resolved during the current build, so media shared
+        # by several shots (slugs, placeholders) is imported only once
+        self._clip_cache: Dict[str, Any] = {}
+        # {id(sequence): (sequence, video_track, audio_track)} for the current
+        # build; the sequence is kept so a recycled id() can never match
+        self._track_cache: Dict[int, Tuple[Any, Any, Any]] = {}
+    
+    def invalidate_cache(self) -> None:
+        """Forget cached scan results, forcing the next build to rescan everything."""
+        self._shots_cache.clear()
+        self._detail_cache.clear()
+        self._track_cache.clear()
+    
+    def _reset_build_state(self) -> None:
+        """Drop the bin index, clip and track lookups that are valid for one build."""
+        self._bin_index = {}
+        self._indexed_bins = set()
+        self._clip_cache = {}
+        self._track_cache = {}
+    
+    def _progress_due(self, current: int, total: int) -> bool:
+        """Throttle intermediate updates; the final one (current == total) always goes out."""
+        now = time.monotonic()
+        if current != total and now - self._last_progress_ts < _PROGRESS_INTERVAL:
+            return False
+        self._last_progress_ts = now
+        return True
     
     def _report_progress(self, message: str, current: int = 0, total: int = 0) -> None:
         """Report progress to callback if set."""
-        if self._progress_callback:
-            self._progress_callback(message, current, total)
+        if self._progress_callback and self._progress_due(current, total):
+            with self._progress_lock:
+                self._progress_callback(message, current, total)
+    
+    def _report_progress_lazy(
+        self, make_message: Callable[[], str], current: int = 0, total: int = 0
+    ) -> None:
+        """Like _report_progress, but only builds the message if it is emitted."""
+        if self._progress_callback and self._progress_due(current, total):
+            with self._progress_lock:
+                self._progress_callback(make_message(), current, total)
+    
+    @staticmethod
+    def _shot_sort_key(shot: str) -> int:
+        """Extract the shot number from a shot name (0 if it has none)."""
+        match = _SHOT_NUM_RE.search(shot)
+        return int(match.group(1)) if match else 0
     
     def _sort_shots(self, shots: List[str]) -> List[str]:
         """Sort shots naturally (SH0010 before SH0020)."""
-        def sort_key(shot: str) -> int:
-            # Extract number from shot name
-            import re
-            match = re.search(r'(\d+)', shot)
-            return int(match.group(1)) if match else 0
-        return sorted(shots, key=sort_key)
-    
-    def _get_media_path(
-        self, ep: str, seq: str, shot: str, dept: str, version: str, media_type: str, shot_data: Dict
-    ) -> Optional[str]:
-        """Get media path for a shot based on media type."""
-        dept_data = shot_data.get(dept, {})
-        
-        if media_type == "mov":
-            mov_files = dept_data.get('mov_files', [])
-            # Find MOV matching version
-            for mov in mov_files:
-                if version in mov:
-                    return mov
-            # Return first MOV if no version match
-            return mov_files[0] if mov_files else None
-        else:
-            # Image sequence
-            seq_files = dept_data.get('sequence_files', [])
-            if seq_files:
-                # Return pattern for sequence
-                return seq_files[0] if seq_files else None
-        return None
+        return sorted(shots, key=self._shot_sort_key)
     
-    def _calculate_positions(self, clips: List[Tuple[str, str, int]]) -> List[TimelinePosition]:
+    @staticmethod
+    def _get_media_path_mov(dept_data: Dict, version: str) -> Tuple[Optional[str], str]:
         """
-        Calculate timeline positions for clips.
+        Get the MOV matching version, else fall back to the latest version's MOV.
         
-        Args:
-            clips: List of (shot_name, clip_path, duration) tuples
-            
         Returns:
-            List of TimelinePosition objects
+            Tuple of (media path or None, version the media belongs to)
+        """
+        mov = dept_data.get('mov_by_version', {}).get(version)
+        if mov:
+            return mov, version
+        mov_files = dept_data.get('mov_files')
+        return (mov_files[0] if mov_files else None), dept_data.get('current_version', version)
+    
+    @staticmethod
+    def _get_media_path_sequence(dept_data: Dict, version: str) -> Tuple[Optional[str], str]:
         """
-        positions = []
-        current_frame = 0
+        Get the first frame of the image sequence.
         
-        for shot_name, clip_path, duration in clips:
-            positions.append(TimelinePosition(
-                shot_name=shot_name,
-                clip_path=clip_path,
-                timeline_in=current_frame,
-                timeline_out=current_frame + duration - 1,
-                duration=duration
-            ))
-            current_frame += duration
+        Only the latest version's frames are scanned, so that is the version
+        returned whatever was asked for.
         
-        return positions
+        Returns:
+            Tuple of (media path or None, version the media belongs to)
+        """
+        seq_files = dept_data.get('sequence_files')
+        return (seq_files[0] if seq_files else None), dept_data.get('current_version', version)
     
-    def build_timeline(self, config: TimelineConfig) -> BuildResult:
+    @staticmethod
+    def _get_bin_path_for_shot(shot_name: str) -> str:
         """
-        Build a timeline based on configuration.
+        Get the bin path for a shot name (Ep01_sq0010_SH0010 -> Ep01/sq0010).
+        
+        That is a sequence bin inside an episode bin; see
+        HieroProject.get_or_create_bin.
+        """
+        i = shot_name.find('_')
+        if i < 0:
+            return shot_name
+        j = shot_name.find('_', i + 1)
+        return f"{shot_name[:i]}/{shot_name[i + 1:j]}" if j > 0 else shot_name
+    
+    def _get_or_create_clips(self, specs: List[Tuple[str, str]]) -> List[Any]:
+        """
+        Resolve clips for (bin_path, media_path) pairs.
+        
+        Clips already present in the bin are reused, as are clips this build
+        already resolved for the same media in another bin; the rest are
+        imported in one batch and added to the bin index for later lookups.
+        Each bin is walked once per build, the first time one of its clips is
+        needed.
         
-        Args:
-            config: TimelineConfig with build parameters
-            
         Returns:
-            BuildResult with success status and details
+            List of clips in the same order as specs (None if creation failed)
         """
-        result = BuildResult(success=False)
-        clips_data = []  # (shot_name, clip_path, duration)
+        index = self._bin_index
+        new_bins = {bin_path for bin_path, _ in specs} - self._indexed_bins
+        if new_bins:
+            index.update(HieroClip.index_bin_clips(list(new_bins)))
+            self._indexed_bins |= new_bins
+        clip_cache = self._clip_cache
+        for spec in specs:
+            clip = index.get(spec)
+            if clip is not None:
+                clip_cache.setdefault(spec[1], clip)
+        # {media_path: bin_path} of media with no clip yet; first bin wins
+        missing = {}
+        for bin_path, media_path in specs:
+            if media_path not in clip_cache:
+                missing.setdefault(media_path, bin_path)
+        if missing:
+            created = HieroClip.create_clips_batch(
+                [(media_path, bin_path, None) for media_path, bin_path in missing.items()]
+            )
+            for (media_path, bin_path), clip in zip(missing.items(), created):
+                index[(bin_path, media_path)] = clip
+                if clip is not None:
+                    clip_cache[media_path] = clip
+        return [index.get(spec) or clip_cache.get(spec[1]) for spec in specs]
+    
+    def _get_sequence_stamp(self, ep: str, seq: str) -> Tuple[int, ...]:
+        """Get the stamp of a sequence folder; it changes when shots are added or removed."""
+        return folder_stamp(os.path.join(self._scanner.project_root, ep, seq))
+    
+    def _get_shots(self, ep: str, seq: str) -> List[str]:
+        """Get sorted shots for a sequence, rescanning only when its folder changed."""
+        key = (ep, seq)
+        stamp = self._get_sequence_stamp(ep, seq)
+        cached = self._shots_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        # The scanner's own cache may predate the change; list the folder
+        shots = self._sort_shots(self._scanner.scan_shots(ep, seq, use_cache=False))
+        self._shots_cache[key] = (stamp, shots)
+        return shots
+    
+    def _iter_shot_lists(self, ep: str, sequences: List[str]) -> Iterator[List[str]]:
+        """
+        Yield the sorted shots of each sequence, in order.
         
-        self._report_progress(f"Building timeline: {config.name}")
+        A FastScanner lists every new or changed sequence in one call;
+        otherwise the sequences are listed concurrently here.
+        """
+        if isinstance(self._scanner, FastScanner):
+            cache = self._shots_cache
+            stamps = {seq: self._get_sequence_stamp(ep, seq) for seq in sequences}
+            stale = [
+                seq for seq in stamps
+                if (cached := cache.get((ep, seq))) is None or cached[0] != stamps[seq]
+            ]
+            if stale:
+                for seq, shots in self._scanner.scan_shots_many(ep, stale, use_cache=False).items():
+                    cache[(ep, seq)] = (stamps[seq], self._sort_shots(shots))
+            for seq in sequences:
+                yield cache[(ep, seq)][1]
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(len(sequences), 8)) as executor:
+            yield from executor.map(partial(self._get_shots, ep), sequences)
+    
+    def _get_shot_stamp_paths(
+        self, ep: str, seq: str, shot: str, latest: Dict[str, Optional[str]]
+    ) -> Tuple[str, ...]:
+        """
+        Get the folders whose mtimes tell whether a shot scan is stale.
         
-        # Collect shots from all sequences
-        all_shots = []
-        for seq in config.sequences:
-            shots = self._scanner.scan_shots(config.episode, seq)
-            for shot in shots:
-                all_shots.append((config.episode, seq, shot))
+        Covers the shot folder, each department with its output and version
+        folders, and the latest version folder the frame list is read from.
+        
+        Args:
+            latest: {department: latest version or None}
+        """
+        shot_path = os.path.join(self._scanner.project_root, ep, seq, shot)
+        paths = [shot_path]
+        for dept, version in latest.items():
+            paths += department_stamp_paths(os.path.join(shot_path, dept), version)
+        return tuple(paths)
+    
+    def _get_shot_detail(self, ep: str, seq: str, shot: str) -> Dict:
+        """Get shot detail, rescanning only when the shot's folders changed."""
+        key = (ep, seq, shot)
+        cached = self._detail_cache.get(key)
+        if cached is not None:
+            paths, stamp, shot_data = cached
+            if stamp is not None and folder_stamp(*paths) == stamp:
+                return shot_data
         
-        total_shots = len(all_shots)
-        self._report_progress(f"Found {total_shots} shots", 0, total_shots)
+        # Relist departments and versions past the scanner's TTL cache, then
+        # stamp before reading media, so a change during the scan is caught
+        # on the next build rather than cached as current
+        scanner = self._scanner
+        latest = {}
+        for dept in scanner.scan_departments(ep, seq, shot, use_cache=False):
+            versions = scanner.scan_versions(ep, seq, shot, dept, use_cache=False)
+            latest[dept] = versions[-1] if versions else None
+        paths = self._get_shot_stamp_paths(ep, seq, shot, latest)
+        stamp = folder_stamp(*paths)
+        # Reads the listings just refreshed above
+        shot_data = scanner.scan_shot_detail(ep, seq, shot)
         
-        # Process each shot
-        for i, (ep, seq, shot) in enumerate(all_shots):
-            self._report_progress(f"Processing {shot}", i + 1, total_shots)
-            
-            shot_data = self._scanner.scan_shot_detail(ep, seq, shot)
-            dept_data = shot_data.get(config.department, {})
+        scanned = {dept: data.get('current_version') for dept, data in shot_data.items()}
+        if scanned != {dept: version for dept, version in latest.items() if version}:
+            stamp = None  # Versions moved between listing and scan; rescan next time
+        self._detail_cache[key] = (paths, stamp, shot_data)
+        return shot_data
+    
+    def _iter_shots_data(
+        self, config: TimelineConfig, result: BuildResult
+    ) -> Iterator[ClipData]:
+        """
+        Yield clip data for every shot in the configured sequences.
+        
+        Sequence listings and shot details are scanned on thread pools since
+        the work is dominated by filesystem latency. Tuples are yielded in
+        timeline order as soon as each shot is ready, so the caller can build
+        the timeline while later shots are still being scanned. Shots that
+        cannot be used are recorded in result.shots_skipped.
+        
+        Yields:
+            ClipData tuples in timeline order
+        """
+        if not config.sequences:
+            return
+        
+        ep = config.episode
+        report = self._report_progress
+        report_lazy = self._report_progress_lazy
+        # media_type is fixed for the build, so pick its path lookup once
+        get_path = (
+            self._get_media_path_mov if config.media_type == "mov"
+            else self._get_media_path_sequence
+        )
+        with ThreadPoolExecutor(max_workers=max(1, config.max_scan_workers)) as executor:
+            # Start scanning each sequence's shots as soon as its listing arrives
+            shot_lists = self._iter_shot_lists(ep, config.sequences)
+            all_shots = []
+            futures = []
+            for seq, shots in zip(config.sequences, shot_lists):
+                report(f"Found {len(shots)} shots in {seq}", 0, len(shots))
+                for shot in shots:
+                    all_shots.append((seq, shot))
+                    futures.append(executor.submit(self._get_shot_detail, ep, seq, shot))
             
-            if not dept_data:
-                result.shots_skipped.append(f"{ep}/{seq}/{shot} (no {config.department})")
-                continue
-
-            # Determine version
-            versions = dept_data.get('versions', [])
-            if not versions:
-                result.shots_skipped.append(f"{ep}/{seq}/{shot} (no versions)")
-                continue
-
-            if config.version == "latest":
-                version = VersionManager.get_latest_version(versions)
-            else:
-                version = config.version if config.version in versions else versions[-1]
+            total_shots = len(all_shots)
+            result.shots_found = total_shots
+            # Collect in submission order, keeping the timeline deterministic
+            for i, ((seq, shot), future) in enumerate(zip(all_shots, futures)):
+                report_lazy(lambda: f"Processing {shot}", i + 1, total_shots)
+                try:
+                    shot_data = future.result()
+                except Exception as e:
+                    result.shots_skipped.append(f"{ep}/{seq}/{shot} (scan failed: {e})")
+                    continue
+                
+                clip_data = self._get_clip_data(config, seq, shot, shot_data, result, get_path)
+                if clip_data:
+                    yield clip_data
+    
+    def _get_clip_data(
+        self,
+        config: TimelineConfig,
+        seq: str,
+        shot: str,
+        shot_data: Dict,
+        result: BuildResult,
+        get_path: Callable[[Dict, str], Tuple[Optional[str], str]]
+    ) -> Optional[ClipData]:
+        """
+        Pick the version and media for a scanned shot.
+        
+        Args:
+            get_path: Media path lookup for the build's media type; returns
+                the path and the version it actually belongs to
+        
+        Returns:
+            ClipData tuple, or None if the shot was skipped
+        """
+        ep = config.episode
+        dept_data = shot_data.get(config.department, {})
+        
+        if not dept_data:
+            result.shots_skipped.append(f"{ep}/{seq}/{shot} (no {config.department})")
+            return None
 
-            # Get media path
-            media_path = self._get_media_path(ep, seq, shot, config.department, version, config.media_type, shot_data)
-            if not media_path:
-                result.shots_skipped.append(f"{ep}/{seq}/{shot} (no {config.media_type} media)")
-                continue
+        # Determine version
+        versions = dept_data.get('versions', [])
+        if not versions:
+            result.shots_skipped.append(f"{ep}/{seq}/{shot} (no versions)")
+            return None
 
-            # Get duration from frame range or default
-            frame_range = dept_data.get('frame_range')
-            duration = (frame_range[1] - frame_range[0] + 1) if frame_range else 100
+        if config.version == "latest":
+            version = VersionManager.get_latest_version(versions)
+        else:
+            version = config.version if config.version in versions else versions[-1]
 
-            clips_data.append((f"{ep}_{seq}_{shot}", media_path, duration))
+        # Get media path; record the version it belongs to, which differs
+        # from the requested one when that version has no such media
+        media_path, version = get_path(dept_data, version)
+        if not media_path:
+            result.shots_skipped.append(f"{ep}/{seq}/{shot} (no {config.media_type} media)")
+            return None
 
-        if not clips_data:
-            result.errors.append("No valid shots found")
-            return result
+        # Get duration from frame range or default
+        frame_range = dept_data.get('frame_range')
+        duration = (frame_range[1] - frame_range[0] + 1) if frame_range else 100
 
+        # Decide once here whether the clip's embedded audio is laid out
+        has_audio = config.include_audio and media_path.endswith(_MOV_SUFFIXES)
+
+        return (f"{ep}_{seq}_{shot}", media_path, version, duration, has_audio)
+    
+    def _resolve_tracks(self, sequence: Any, create_audio: bool = False) -> Tuple[Any, Any]:
+        """
+        Get the (video_track, audio_track) a build writes to.
+        
+        Uses the first existing track of each kind, adding a video track if
+        the sequence has none and an audio track only when create_audio is
+        set. Results are cached per sequence.
+        
+        Returns:
+            Tuple of (video_track, audio_track); audio_track may be None
+        """
+        cached = self._track_cache.get(id(sequence))
+        if cached is not None and cached[0] is sequence:
+            _, video_track, audio_track = cached
+            if audio_track is not None or not create_audio:
+                return video_track, audio_track
+        else:
+            video_tracks = sequence.videoTracks()
+            video_track = video_tracks[0] if video_tracks else HieroTimeline.add_video_track(sequence, "Video")
+            audio_track = None
+        
+        if audio_track is None:
+            audio_tracks = sequence.audioTracks()
+            if audio_tracks:
+                audio_track = audio_tracks[0]
+            elif create_audio:
+                audio_track = HieroTimeline.add_audio_track(sequence, "Audio")
+        
+        self._track_cache[id(sequence)] = (sequence, video_track, audio_track)
+        return video_track, audio_track
+    
+    def _calculate_positions(self, clips: Iterable[ClipData]) -> Iterator[TimelinePosition]:
+        """
+        Calculate timeline positions for clips, lazily.
+        
+        Args:
+            clips: Iterable of ClipData tuples
+            
+        Yields:
+            TimelinePosition objects laid out back to back from frame 0
+        """
+        # Start frames are the running sum of durations; tee keeps this lazy
+        clips, for_durations = tee(clips)
+        starts = accumulate((clip[3] for clip in for_durations), initial=0)
+        
+        for (shot_name, clip_path, version, duration, has_audio), timeline_in in zip(clips, starts):
+            yield TimelinePosition(
+                shot_name=shot_name,
+                clip_path=clip_path,
+                timeline_in=timeline_in,
+                timeline_out=timeline_in + duration - 1,
+                duration=duration,
+                version=version,
+                has_audio=has_audio
+            )
+    
+    @staticmethod
+    def _get_build_hash(clips_data: List[ClipData], config: TimelineConfig) -> str:
+        """Fingerprint the shots, media and versions a build would lay out."""
+        content = repr((config.department, sorted(clips_data)))
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+    
+    def _create_new_timeline(
+        self,
+        clips_data: Iterable[ClipData],
+        config: TimelineConfig,
+        result: BuildResult
+    ) -> None:
+        """
+        Create a new sequence and lay the clips out back to back.
+        
+        clips_data may be a live scan iterator; clips are imported in small
+        batches as shots arrive.
+        """
         # Calculate timeline positions
         positions = self._calculate_positions(clips_data)
 
         # Create Hiero sequence and tracks
-        try:
-            sequence = HieroTimeline.create_sequence(config.name, config.fps)
-            video_track = HieroTimeline.add_video_track(sequence, "Video")
-
-            # Add clips to track
-            for pos in positions:
-                clip = HieroClip.create_clip(pos.clip_path)
-                item = HieroTrackItem.add_item_to_track(
-                    video_track, clip, pos.timeline_in, pos.timeline_out
+        sequence = HieroTimeline.create_sequence(config.name, config.fps)
+        video_track = HieroTimeline.add_video_track(sequence, "Video")
+        audio_track = None
+        self._track_cache[id(sequence)] = (sequence, video_track, audio_track)
+
+        # Bind per-shot calls to locals for the loop
+        add_item = HieroTrackItem.add_item_to_track
+        add_av_pair = HieroTrackItem.add_av_pair
+        set_metadata = HieroTrackItem.set_metadata_batch
+        # The department is constant for the build; only per-shot keys are merged in
+        base_meta = {"department": config.department}
+
+        # Clip data of the shots actually placed on the timeline
+        laid_out: List[ClipData] = []
+        with HieroTimeline.batched_edit(sequence):
+            while True:
+                batch = list(islice(positions, _CLIP_BATCH_SIZE))
+                if not batch:
+                    break
+                # Resolve clips in their Episode/sequence bins, importing missing ones in one undo group
+                clips = self._get_or_create_clips(
+                    [(self._get_bin_path_for_shot(pos.shot_name), pos.clip_path) for pos in batch]
                 )
-                # Add metadata
-                HieroTrackItem.set_metadata(item, "shot", pos.shot_name)
-                HieroTrackItem.set_metadata(item, "department", config.department)
-                HieroTrackItem.set_metadata(item, "version", config.version)
 
+                # Add clips to track
+                for pos, clip in zip(batch, clips):
+                    if clip is None:
+                        result.errors.append(f"Failed to import {pos.clip_path} for {pos.shot_name}")
+                        result.shots_skipped.append(f"{pos.shot_name} (import failed)")
+                        continue
+                    if pos.has_audio:
+                        if audio_track is None:
+                            audio_track = self._resolve_tracks(sequence, create_audio=True)[1]
+                        item, _ = add_av_pair(
+                            video_track, audio_track, clip, pos.timeline_in, pos.timeline_out
+                        )
+                    else:
+                        item = add_item(
+                            video_track, clip, pos.timeline_in, pos.timeline_out
+                        )
+                    # Add metadata
+                    set_metadata(item, {
+                        **base_meta,
+                        "shot": pos.shot_name,
+                        "version": pos.version,
+                        "media_path": pos.clip_path,
+                    })
+                    laid_out.append(
+                        (pos.shot_name, pos.clip_path, pos.version, pos.duration, pos.has_audio)
+                    )
+
+        # Lets a later update of this sequence skip work if nothing changed.
+        # Shots that failed to import are left out, so that update adds them.
+        HieroTimeline.set_metadata(sequence, _BUILD_HASH_KEY, self._get_build_hash(laid_out, config))
+        result.success = True
+        result.sequence = sequence
+        result.shots_added = len(laid_out)
+    
+    def _update_existing_timeline(
+        self,
+        sequence: Any,
+        clips_data: List[ClipData],
+        config: TimelineConfig,
+        result: BuildResult
+    ) -> None:
+        """
+        Update an existing sequence in place.
+        
+        Shots already on the timeline (matched by their "shot" metadata) get
+        their source swapped if the media changed and are otherwise left
+        alone; new shots are appended after the last item. If the sequence
+        was last built from identical clip data, nothing is touched.
+        Results are counted as added, updated and unchanged.
+        """
+        build_hash = self._get_build_hash(clips_data, config)
+        if HieroTimeline.get_metadata(sequence, _BUILD_HASH_KEY) == build_hash:
             result.success = True
             result.sequence = sequence
-            result.shots_added = len(positions)
+            result.shots_unchanged = len(clips_data)
+            return
+
+        video_track, audio_track = self._resolve_tracks(sequence)
+
+        existing_items = {}
+        for item in video_track.items():
+            shot_name = HieroTrackItem.get_metadata(item, "shot")
+            if shot_name:
+                existing_items[shot_name] = item
+
+        # The sequence tracks its own duration; one call instead of one per item
+        end_frame = HieroTimeline.get_timeline_end(sequence)
+
+        # Only new shots and shots whose media changed need a clip
+        needed = [
+            (shot_name, media_path) for shot_name, media_path, *_ in clips_data
+            if (item := existing_items.get(shot_name)) is None
+            or HieroTrackItem.get_source_path(item) != media_path
+        ]
+        new_clips = dict(zip(
+            (shot_name for shot_name, _ in needed),
+            self._get_or_create_clips(
+                [(self._get_bin_path_for_shot(shot_name), media_path) for shot_name, media_path in needed]
+            )
+        ))
 
+        # Bind per-shot calls to locals for the loop
+        add_item = HieroTrackItem.add_item_to_track
+        add_av_pair = HieroTrackItem.add_av_pair
+        set_metadata = HieroTrackItem.set_metadata_batch
+        # The department is constant for the build; only per-shot keys are merged in
+        base_meta = {"department": config.department}
+
+        shots_added = shots_updated = shots_unchanged = 0
+        with HieroTimeline.batched_edit(sequence):
+            for shot_name, media_path, version, duration, has_audio in clips_data:
+                item = existing_items.get(shot_name)
+                if shot_name not in new_clips:
+                    # On the timeline with the same media already
+                    shots_unchanged += 1
+                    continue
+                clip = new_clips[shot_name]
+                if clip is None:
+                    result.errors.append(f"Failed to import {media_path} for {shot_name}")
+                    result.shots_skipped.append(f"{shot_name} (import failed)")
+                    continue
+                if item is not None:
+                    if not HieroTrackItem.update_item_source(item, clip):
+                        result.errors.append(
+                            f"Failed to update {shot_name} at frame {item.timelineIn()}"
+                        )
+                        continue
+                    shots_updated += 1
+                else:
+                    timeline_out = end_frame + duration - 1
+                    if has_audio:
+                        if audio_track is None:
+                            audio_track = self._resolve_tracks(sequence, create_audio=True)[1]
+                        item, _ = add_av_pair(
+                            video_track, audio_track, clip, end_frame, timeline_out
+                        )
+                    else:
+                        item = add_item(
+                            video_track, clip, end_frame, timeline_out
+                        )
+                    end_frame += duration
+                    shots_added += 1
+                set_metadata(item, {
+                    **base_meta,
+                    "shot": shot_name,
+                    "version": version,
+                    "media_path": media_path,
+                })
+
+        if not result.errors:
+            HieroTimeline.set_metadata(sequence, _BUILD_HASH_KEY, build_hash)
+        result.success = True
+        result.sequence = sequence
+        result.shots_added = shots_added
+        result.shots_updated = shots_updated
+        result.shots_unchanged = shots_unchanged
+    
+    def build_timeline(self, config: TimelineConfig) -> BuildResult:
+        """
+        Build a timeline based on configuration.
+        
+        Args:
+            config: TimelineConfig with build parameters
+            
+        Returns:
+            BuildResult with success status and details
+        """
+        result = BuildResult(success=False)
+        
+        self._report_progress(f"Building timeline: {config.name}")
+        
+        shots_iter = self._iter_shots_data(config, result)
+        first = next(shots_iter, None)
+        if first is None:
+            result.errors.append("No valid shots found")
+            return result
+        clips_data = chain((first,), shots_iter)
+
+        # Bins are indexed lazily so existing clips are reused, not re-imported
+        self._reset_build_state()
+
+        try:
+            existing = (
+                HieroTimeline.get_sequence_by_name(config.name)
+                if config.update_existing else None
+            )
+            if existing is not None:
+                self._update_existing_timeline(existing, list(clips_data), config, result)
+            else:
+                # Streams: clips are created while later shots are still scanning
+                self._create_new_timeline(clips_data, config, result)
         except Exception as e:
             result.errors.append(f"Failed to create timeline: {str(e)}")
+        finally:
+            shots_iter.close()
+            # Don't hold on to Hiero objects between builds
+            self._reset_build_state()
 
+        total_shots = result.shots_found
         self._report_progress("Timeline build complete", total_shots, total_shots)
         return result
 
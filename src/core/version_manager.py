@@ -4,7 +4,46 @@ Version Manager Module
 Version detection, sorting, comparison, and manipulation.
 """
 import re
-from typing import List, Optional, Tuple
+import sys
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+
+# Pattern to extract version number
+_VERSION_RE = re.compile(r'^[vV](\d+)$')
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(version_str: str) -> Optional[int]:
+    """
+    Parse version string to integer, or None if invalid.
+    
+    Memoized since sorting and comparing re-parse the same few
+    version strings many times. Parsed by hand rather than with
+    _VERSION_RE; isdecimal() accepts exactly what its \\d+ matches.
+    """
+    s = version_str.strip()
+    if len(s) < 2 or s[0] not in 'vV':
+        return None
+    digits = s[1:]
+    return int(digits) if digits.isdecimal() else None
+
+
+def _parse_version_or(version_str: str, default: int) -> int:
+    """Parse a version, returning default only when it is invalid (v000 is 0)."""
+    num = _parse_version(version_str)
+    return default if num is None else num
+
+
+def _version_sort_key(version_str: str) -> Tuple[int, int]:
+    """Sort key of small ints: valid versions by number, then invalid ones."""
+    num = _parse_version(version_str)
+    return (0, num) if num is not None else (1, 0)
+
+
+def _version_max_key(version_str: str) -> int:
+    """Key for max(): version number, with invalid versions ranked lowest."""
+    return _parse_version_or(version_str, -1)
 
 
 class VersionManager:
@@ -15,7 +54,7 @@ class VersionManager:
     """
     
     # Pattern to extract version number
-    VERSION_RE = re.compile(r'^[vV](\d+)$')
+    VERSION_RE = _VERSION_RE
     
     @staticmethod
     def parse_version(version_str: str) -> Optional[int]:
@@ -32,10 +71,7 @@ class VersionManager:
             >>> VersionManager.parse_version("v009")
             9
         """
-        match = VersionManager.VERSION_RE.match(version_str.strip())
-        if match:
-            return int(match.group(1))
-        return None
+        return _parse_version(version_str)
     
     @staticmethod
     def format_version(version_num: int, padding: int = 3) -> str:
@@ -53,7 +89,13 @@ class VersionManager:
             >>> VersionManager.format_version(9)
             'v009'
         """
-        return f"v{version_num:0{padding}d}"
+        # Constant format specs for the common paddings skip building one per call;
+        # the few distinct results are interned so lists of them share objects
+        if padding == 3:
+            return sys.intern(f"v{version_num:03d}")
+        if padding == 4:
+            return sys.intern(f"v{version_num:04d}")
+        return sys.intern("v" + str(version_num).zfill(padding))
     
     @staticmethod
     def sort_versions(versions: List[str]) -> List[str]:
@@ -70,11 +112,7 @@ class VersionManager:
             >>> VersionManager.sort_versions(['v010', 'v002', 'v001'])
             ['v001', 'v002', 'v010']
         """
-        def sort_key(v):
-            num = VersionManager.parse_version(v)
-            return num if num is not None else float('inf')
-        
-        return sorted(versions, key=sort_key)
+        return sorted(versions, key=_version_sort_key)
     
     @staticmethod
     def get_latest_version(versions: List[str]) -> Optional[str]:
@@ -87,18 +125,13 @@ class VersionManager:
         Returns:
             Highest version string, or None if empty
         """
-        if not versions:
-            return None
-        sorted_versions = VersionManager.sort_versions(versions)
-        return sorted_versions[-1] if sorted_versions else None
+        # One linear pass; invalid strings only win if nothing parses
+        return max(versions, key=_version_max_key, default=None)
     
     @staticmethod
     def get_earliest_version(versions: List[str]) -> Optional[str]:
         """Get the lowest version from a list."""
-        if not versions:
-            return None
-        sorted_versions = VersionManager.sort_versions(versions)
-        return sorted_versions[0] if sorted_versions else None
+        return min(versions, key=_version_sort_key, default=None)
     
     @staticmethod
     def increment_version(current: str, padding: int = 3) -> str:
@@ -112,7 +145,10 @@ class VersionManager:
         Returns:
             Next version string
         """
-        num = VersionManager.parse_version(current)
+        # Fast path for already well-formed versions like "v009"
+        if len(current) >= 2 and current[0] in 'vV' and (digits := current[1:]).isdecimal():
+            return VersionManager.format_version(int(digits) + 1, padding)
+        num = _parse_version(current)
         if num is None:
             return VersionManager.format_version(1, padding)
         return VersionManager.format_version(num + 1, padding)
@@ -129,7 +165,10 @@ class VersionManager:
         Returns:
             Previous version string, or None if already at v001
         """
-        num = VersionManager.parse_version(current)
+        if len(current) >= 2 and current[0] in 'vV' and (digits := current[1:]).isdecimal():
+            num = int(digits)
+        else:
+            num = _parse_version(current)
         if num is None or num <= 1:
             return None
         return VersionManager.format_version(num - 1, padding)
@@ -142,8 +181,9 @@ class VersionManager:
         Returns:
             -1 if v1 < v2, 0 if equal, 1 if v1 > v2
         """
-        num1 = VersionManager.parse_version(v1) or 0
-        num2 = VersionManager.parse_version(v2) or 0
+        # Invalid versions sort below v000
+        num1 = _parse_version_or(v1, -1)
+        num2 = _parse_version_or(v2, -1)
         
         if num1 < num2:
             return -1
@@ -152,23 +192,39 @@ class VersionManager:
         return 0
     
     @staticmethod
-    def get_version_range(start: str, end: str, padding: int = 3) -> List[str]:
+    def iter_version_range(start: str, end: str, padding: int = 3) -> Iterator[str]:
         """
-        Generate list of versions in a range.
+        Lazily generate versions in a range, lowest first.
         
         Args:
             start: Start version (inclusive)
             end: End version (inclusive)
             padding: Number of digits
             
-        Returns:
-            List of version strings in range
+        Yields:
+            Version strings in range
         """
-        start_num = VersionManager.parse_version(start) or 1
-        end_num = VersionManager.parse_version(end) or 1
+        start_num = _parse_version_or(start, 1)
+        end_num = _parse_version_or(end, 1)
         
         if start_num > end_num:
             start_num, end_num = end_num, start_num
         
-        return [VersionManager.format_version(i, padding) for i in range(start_num, end_num + 1)]
-
+        format_version = VersionManager.format_version
+        for i in range(start_num, end_num + 1):
+            yield format_version(i, padding)
+    
+    @staticmethod
+    def get_version_range(start: str, end: str, padding: int = 3) -> List[str]:
+        """
+        Generate list of versions in a range.
+        
+        Args:
+            start: Start version (inclusive)
+            end: End version (inclusive)
+            padding: Number of digits
+            
+        Returns:
+            List of version strings in range
+        """
+        return list(VersionManager.iter_version_range(start, end, padding))
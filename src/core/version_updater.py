@@ -3,7 +3,10 @@ Version Updater Module
 =======================
 Update clips to different versions while maintaining timeline structure.
 """
-from typing import List, Dict, Optional, Any, Callable
+import re
+import time
+from functools import lru_cache
+from typing import List, Optional, Any, Callable, Tuple, NamedTuple
 from dataclasses import dataclass, field
 
 from .version_manager import VersionManager
@@ -11,6 +14,47 @@ from .hiero_wrapper import HieroClip, HieroTrackItem, HIERO_AVAILABLE
 from .file_scanner import ProjectScanner
 
 
+# Minimum seconds between intermediate progress callbacks
+_PROGRESS_INTERVAL = 0.05
+
+# Version token in a media path, e.g. "_v009" or "/v009"
+_PATH_VERSION_RE = re.compile(r'[_/](v\d{3,4})', re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
+def _rewrite_path_version(current_path: str, new_version: str) -> Optional[str]:
+    """Replace the version tokens in a path, or None if it has none."""
+    # Splice the new version over each match's version span; the separator
+    # before it is kept, so a /v009/ folder stays a folder
+    if 'v' not in current_path and 'V' not in current_path:
+        return None
+    parts = []
+    last = 0
+    for match in _PATH_VERSION_RE.finditer(current_path):
+        start, end = match.span(1)
+        parts.append(current_path[last:start])
+        parts.append(new_version)
+        last = end
+    if not parts:
+        return None
+    parts.append(current_path[last:])
+    new_path = ''.join(parts)
+    return new_path if new_path != current_path else None
+
+
+def _bulk_rewrite_paths(paths: List[str], new_version: str) -> List[Optional[str]]:
+    """Rewrite the version in each path; None where a path has no version."""
+    rewrite = _rewrite_path_version
+    return [rewrite(path, new_version) for path in paths]
+
+
+class Change(NamedTuple):
+    """One version change applied to a track item."""
+    shot: str
+    old_version: str
+    new_version: str
+
+
 @dataclass
 class UpdateResult:
     """Result of version update operation."""
@@ -18,7 +62,7 @@ class UpdateResult:
     updated_count: int = 0
     skipped_count: int = 0
     errors: List[str] = field(default_factory=list)
-    changes: List[Dict[str, str]] = field(default_factory=list)  # {shot, old_version, new_version}
+    changes: List[Change] = field(default_factory=list)
 
 
 class VersionUpdater:
@@ -40,43 +84,64 @@ class VersionUpdater:
         """
         self._scanner = scanner
         self._progress_callback = progress_callback
+        self._last_progress_ts = 0.0
+    
+    def _progress_due(self, current: int, total: int) -> bool:
+        """Throttle intermediate updates; the final one (current == total) always goes out."""
+        now = time.monotonic()
+        if current != total and now - self._last_progress_ts < _PROGRESS_INTERVAL:
+            return False
+        self._last_progress_ts = now
+        return True
     
     def _report_progress(self, message: str, current: int = 0, total: int = 0) -> None:
-        if self._progress_callback:
+        if self._progress_callback and self._progress_due(current, total):
             self._progress_callback(message, current, total)
     
+    def _report_progress_lazy(
+        self, make_message: Callable[[], str], current: int = 0, total: int = 0
+    ) -> None:
+        """Like _report_progress, but only builds the message if it is emitted."""
+        if self._progress_callback and self._progress_due(current, total):
+            self._progress_callback(make_message(), current, total)
+    
     def get_item_current_version(self, track_item: Any) -> Optional[str]:
         """
         Get current version from track item.
         
         Extracts version from source media path.
         """
-        try:
-            if HIERO_AVAILABLE:
-                source = track_item.source()
-                media = source.mediaSource()
-                path = media.fileinfos()[0].filename()
-            else:
-                # Mock mode
-                path = track_item.clip._path if hasattr(track_item, 'clip') else ""
-            
-            # Extract version from path
-            import re
-            match = re.search(r'[_/](v\d{3,4})', path, re.IGNORECASE)
-            return match.group(1) if match else None
-        except Exception:
-            return None
+        return self._extract_path_and_version(track_item)[1]
+    
+    @staticmethod
+    def _extract_path_and_version(track_item: Any) -> Tuple[str, Optional[str]]:
+        """
+        Read a track item's source path and the version in it.
+        
+        Returns:
+            Tuple of (path, version); path is "" and version None if the
+            item has no media or its source cannot be read, version is None
+            if the path has no version
+        """
+        path = HieroTrackItem.get_source_path(track_item)
+        if not path:
+            return "", None
+        # Cheap substring test first; paths without a "v" cannot match
+        if 'v' not in path and 'V' not in path:
+            return path, None
+        match = _PATH_VERSION_RE.search(path)
+        return path, match.group(1) if match else None
     
     def _get_new_media_path(
         self, current_path: str, new_version: str, media_type: str = "mov"
     ) -> Optional[str]:
         """
         Generate new media path with different version.
+        
+        Memoized on (current_path, new_version), since toggling between
+        versions rewrites the same paths again.
         """
-        import re
-        # Replace version in path
-        new_path = re.sub(r'[_/]v\d{3,4}', f'_{new_version}', current_path, flags=re.IGNORECASE)
-        return new_path if new_path != current_path else None
+        return _rewrite_path_version(current_path, new_version)
     
     def update_shot_version(
         self, track_item: Any, new_version: str, dept: str = None
@@ -92,26 +157,35 @@ class VersionUpdater:
         Returns:
             True if updated successfully
         """
+        # One source lookup serves both the version check and the rewrite;
+        # Hiero errors are handled where the source is read and swapped
+        current_path, current_version = self._extract_path_and_version(track_item)
+        return self._update_from_path(track_item, current_path, current_version, new_version)
+    
+    def _update_from_path(
+        self, track_item: Any, current_path: str, current_version: Optional[str], new_version: str
+    ) -> bool:
+        """Update a track item whose source path and version were already read."""
+        if current_version == new_version:
+            return True  # Already at target version
+        
+        new_path = self._get_new_media_path(current_path, new_version)
+        if not new_path:
+            return False
+        
+        return self._swap_source(track_item, new_path, new_version)
+    
+    def _swap_source(self, track_item: Any, new_path: str, new_version: str) -> bool:
+        """Point a track item at new media and record the version it now shows."""
         try:
-            current_version = self.get_item_current_version(track_item)
-            if current_version == new_version:
-                return True  # Already at target version
-            
-            # Get current path and generate new path
-            if HIERO_AVAILABLE:
-                source = track_item.source()
-                current_path = source.mediaSource().fileinfos()[0].filename()
-            else:
-                current_path = track_item.clip._path if hasattr(track_item, 'clip') else ""
-            
-            new_path = self._get_new_media_path(current_path, new_version)
-            if not new_path:
-                return False
-            
-            # Create new clip and update source
             new_clip = HieroClip.create_clip(new_path)
-            return HieroTrackItem.update_item_source(track_item, new_clip)
-            
+            if not HieroTrackItem.update_item_source(track_item, new_clip):
+                return False
+            HieroTrackItem.set_metadata_batch(track_item, {
+                "version": new_version,
+                "media_path": new_path,
+            })
+            return True
         except Exception as e:
             print(f"[VersionUpdater] Error updating version: {e}")
             return False
@@ -137,20 +211,61 @@ class VersionUpdater:
         total = len(items)
         self._report_progress(f"Updating {total} items to {new_version}", 0, total)
         
-        for i, item in enumerate(items):
-            old_version = self.get_item_current_version(item)
-            
-            if self.update_shot_version(item, new_version):
+        # Read every source path once, then rewrite them all in one pass
+        paths, old_versions = (
+            zip(*map(self._extract_path_and_version, items)) if items else ((), ())
+        )
+        new_paths = _bulk_rewrite_paths(paths, new_version)
+        report_lazy = self._report_progress_lazy
+        
+        for i, (item, old_version, new_path) in enumerate(zip(items, old_versions, new_paths)):
+            # Items already at the target count as updated, as in update_shot_version
+            if old_version == new_version or (
+                new_path and self._swap_source(item, new_path, new_version)
+            ):
                 result.updated_count += 1
-                result.changes.append({
-                    'shot': f"Item {i}",
-                    'old_version': old_version or "unknown",
-                    'new_version': new_version
-                })
+                result.changes.append(Change(f"Item {i}", old_version or "unknown", new_version))
             else:
                 result.skipped_count += 1
             
-            self._report_progress(f"Updated item {i+1}", i + 1, total)
+            report_lazy(lambda: f"Updated item {i+1}", i + 1, total)
+        
+        return result
+    
+    def update_items(
+        self,
+        items: List[Any],
+        new_version_for: Callable[[Any, Optional[str]], Optional[str]]
+    ) -> UpdateResult:
+        """
+        Update several track items, each to a version chosen per item.
+        
+        Every item's path and current version are read first, then all
+        changes are applied.
+        
+        Args:
+            items: Track items to update
+            new_version_for: Callable(item, current_version) returning the
+                target version, or None to leave the item alone
+            
+        Returns:
+            UpdateResult with counts and details
+        """
+        result = UpdateResult(success=True)
+        
+        planned = []
+        for item in items:
+            path, current = self._extract_path_and_version(item)
+            new_version = new_version_for(item, current)
+            if new_version:
+                planned.append((item, path, current, new_version))
+        
+        for i, (item, path, current, new_version) in enumerate(planned):
+            if self._update_from_path(item, path, current, new_version):
+                result.updated_count += 1
+                result.changes.append(Change(f"Item {i}", current or "unknown", new_version))
+            else:
+                result.skipped_count += 1
         
         return result
     
@@ -160,10 +275,10 @@ class VersionUpdater:
         items = track.items() if hasattr(track, 'items') else []
         
         for item in items:
-            current = self.get_item_current_version(item)
+            path, current = self._extract_path_and_version(item)
             if current:
                 new_ver = VersionManager.increment_version(current)
-                if self.update_shot_version(item, new_ver):
+                if self._update_from_path(item, path, current, new_ver):
                     result.updated_count += 1
                 else:
                     result.skipped_count += 1
@@ -176,10 +291,10 @@ class VersionUpdater:
         items = track.items() if hasattr(track, 'items') else []
         
         for item in items:
-            current = self.get_item_current_version(item)
+            path, current = self._extract_path_and_version(item)
             if current:
                 new_ver = VersionManager.decrement_version(current)
-                if new_ver and self.update_shot_version(item, new_ver):
+                if new_ver and self._update_from_path(item, path, current, new_ver):
                     result.updated_count += 1
                 else:
                     result.skipped_count += 1
@@ -4,11 +4,30 @@ Data Models for Hiero Review Tool
 Dataclasses for type-safe configuration and data handling.
 """
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 import re
+import sys
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _compile_patterns(
+    episode_regex: str, sequence_regex: str, shot_regex: str, version_regex: str
+) -> Tuple[re.Pattern, re.Pattern, re.Pattern, re.Pattern]:
+    """
+    Compile a set of naming patterns once per distinct set of strings.
+    
+    Names are ASCII, so re.ASCII lets \\d and \\w skip Unicode lookups.
+    """
+    return (
+        re.compile(episode_regex, re.ASCII),
+        re.compile(sequence_regex, re.ASCII),
+        re.compile(shot_regex, re.ASCII),
+        re.compile(version_regex, re.ASCII),
+    )
+
+
+@dataclass(slots=True)
 class NamingPatterns:
     """Regex patterns for parsing file/folder names."""
     episode_regex: str = r"Ep\d{2}"
@@ -17,16 +36,19 @@ class NamingPatterns:
     version_regex: str = r"v\d{3,4}"
     
     def compile_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile all regex patterns."""
+        """Compile all regex patterns (memoized on the pattern strings)."""
+        episode, sequence, shot, version = _compile_patterns(
+            self.episode_regex, self.sequence_regex, self.shot_regex, self.version_regex
+        )
         return {
-            'episode': re.compile(self.episode_regex),
-            'sequence': re.compile(self.sequence_regex),
-            'shot': re.compile(self.shot_regex),
-            'version': re.compile(self.version_regex),
+            'episode': episode,
+            'sequence': sequence,
+            'shot': shot,
+            'version': version,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaPaths:
     """Media directory paths for a project."""
     import_dir: str = ""
@@ -34,7 +56,7 @@ class MediaPaths:
     audio_dir: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectSettings:
     """Project-level settings."""
     fps: float = 24.0
@@ -44,7 +66,7 @@ class ProjectSettings:
     default_media_type: str = "mov"
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheSettings:
     """Cache configuration settings."""
     enabled: bool = True
@@ -117,7 +139,7 @@ class ProjectConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DepartmentInfo:
     """Information about a department's output for a shot."""
     name: str
@@ -127,9 +149,14 @@ class DepartmentInfo:
     has_sequence: bool = False
     output_path: str = ""
     version_path: str = ""
+    
+    def __post_init__(self):
+        # Department and version names repeat across every shot of a project
+        self.name = sys.intern(self.name)
+        self.versions = [sys.intern(v) for v in self.versions]
 
 
-@dataclass
+@dataclass(slots=True)
 class ShotInfo:
     """Information about a single shot."""
     episode: str
@@ -139,6 +166,12 @@ class ShotInfo:
     frame_range: Tuple[int, int] = (1001, 1100)
     audio_path: Optional[str] = None
     
+    def __post_init__(self):
+        # Shot numbers like SH0010 recur in every sequence
+        self.episode = sys.intern(self.episode)
+        self.sequence = sys.intern(self.sequence)
+        self.shot = sys.intern(self.shot)
+    
     @property
     def full_name(self) -> str:
         """Get full shot name (e.g., 'Ep01_sq0030_SH0060')."""
@@ -154,7 +187,7 @@ class ScanResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """A single cache entry with TTL."""
     data: Any
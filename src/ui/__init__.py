@@ -1,47 +1,53 @@
 """
 UI components for Hiero Review Tool.
-"""
 
-from .main_dialog import ReviewToolDialog
-from .selector_widget import EpisodeSelector, SequenceSelector, ShotSelector
-from .version_widget import VersionControlWidget, VersionInfoWidget, VersionPanel
-from .progress_widget import (
-    ProgressWidget, StatusLogWidget, ProgressPanel,
-    MessageLevel, create_progress_callback,
-)
-from .menu_integration import (
-    register_menu, unregister_menu, show_review_tool_dialog,
-    register_on_startup,
-)
-from .context_menu import TrackItemContextMenu, register_context_menu
-from .preferences_dialog import PreferencesDialog
+Exports are imported lazily on first access (PEP 562), so importing the
+package at Hiero startup does not load every Qt widget module.
+"""
+from importlib import import_module
 
-__all__ = [
+# {exported name: submodule that defines it}
+_EXPORTS = {
     # Main dialog
-    'ReviewToolDialog',
+    'ReviewToolDialog': '.main_dialog',
     # Selectors
-    'EpisodeSelector',
-    'SequenceSelector',
-    'ShotSelector',
+    'EpisodeSelector': '.selector_widget',
+    'SequenceSelector': '.selector_widget',
+    'ShotSelector': '.selector_widget',
     # Version
-    'VersionControlWidget',
-    'VersionInfoWidget',
-    'VersionPanel',
+    'VersionControlWidget': '.version_widget',
+    'VersionInfoWidget': '.version_widget',
+    'VersionPanel': '.version_widget',
     # Progress
-    'ProgressWidget',
-    'StatusLogWidget',
-    'ProgressPanel',
-    'MessageLevel',
-    'create_progress_callback',
+    'ProgressWidget': '.progress_widget',
+    'StatusLogWidget': '.progress_widget',
+    'ProgressPanel': '.progress_widget',
+    'MessageLevel': '.progress_widget',
+    'create_progress_callback': '.progress_widget',
     # Menu
-    'register_menu',
-    'unregister_menu',
-    'show_review_tool_dialog',
-    'register_on_startup',
+    'register_menu': '.menu_integration',
+    'unregister_menu': '.menu_integration',
+    'show_review_tool_dialog': '.menu_integration',
+    'register_on_startup': '.menu_integration',
     # Context menu
-    'TrackItemContextMenu',
-    'register_context_menu',
+    'TrackItemContextMenu': '.context_menu',
+    'register_context_menu': '.context_menu',
     # Preferences
-    'PreferencesDialog',
-]
+    'PreferencesDialog': '.preferences_dialog',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
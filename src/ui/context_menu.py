@@ -6,7 +6,7 @@ Right-click context menu for timeline track items.
 import os
 import subprocess
 import platform
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Callable, Dict, Tuple
 
 try:
     from PySide2.QtWidgets import QMenu, QAction, QMessageBox
@@ -32,6 +32,20 @@ except ImportError:
     HIERO_AVAILABLE = False
 
 from ..core import VersionManager, VersionUpdater, DepartmentSwitcher, ProjectScanner
+from ..core.file_scanner import department_stamp_paths, folder_stamp
+from ..core.hiero_wrapper import HieroTimeline
+from ..utils.path_parser import parse_shot_path
+
+
+# Command that reveals a file in the system file browser, chosen once per platform
+_EXPLORER_COMMANDS = {
+    "Windows": lambda path, directory: ['explorer', '/select,', path],
+    "Darwin": lambda path, directory: ['open', '-R', path],  # macOS
+}
+_explorer_command = _EXPLORER_COMMANDS.get(
+    platform.system(),
+    lambda path, directory: ['xdg-open', directory]  # Linux
+)
 
 
 class TrackItemContextMenu(QObject):
@@ -45,21 +59,47 @@ class TrackItemContextMenu(QObject):
     - Shot properties
     """
     
+    # Departments offered by the "Switch Department" submenu
+    _DEPARTMENTS = ('comp', 'light', 'anim', 'fx')
+    
     def __init__(self, scanner: Optional[ProjectScanner] = None):
         super().__init__()
         self._scanner = scanner
+        # Created from the scanner on first use; see the properties below
         self._version_updater: Optional[VersionUpdater] = None
         self._dept_switcher: Optional[DepartmentSwitcher] = None
-        
-        if scanner:
-            self._version_updater = VersionUpdater(scanner)
-            self._dept_switcher = DepartmentSwitcher(scanner)
+        # {department folder: (stamped folders, their mtimes, sorted versions)}
+        self._version_cache: Dict[str, Tuple[Tuple[str, ...], Tuple[int, ...], List[str]]] = {}
+        # Menu from the previous right-click, released when the next is built
+        self._last_menu: Optional[QMenu] = None
+    
+    @property
+    def version_updater(self) -> Optional[VersionUpdater]:
+        """Version updater for the current scanner, created on first use."""
+        if self._version_updater is None and self._scanner is not None:
+            self._version_updater = VersionUpdater(self._scanner)
+        return self._version_updater
+    
+    @property
+    def department_switcher(self) -> Optional[DepartmentSwitcher]:
+        """Department switcher for the current scanner, created on first use."""
+        if self._dept_switcher is None and self._scanner is not None:
+            self._dept_switcher = DepartmentSwitcher(self._scanner)
+        return self._dept_switcher
     
     def set_scanner(self, scanner: ProjectScanner) -> None:
-        """Set the project scanner."""
+        """
+        Set the project scanner.
+        
+        Setting the scanner already in use is a no-op, so the helpers and
+        version cache built for it are kept.
+        """
+        if scanner is self._scanner:
+            return
         self._scanner = scanner
-        self._version_updater = VersionUpdater(scanner)
-        self._dept_switcher = DepartmentSwitcher(scanner)
+        self._version_updater = None
+        self._dept_switcher = None
+        self._version_cache.clear()
     
     def build_menu(self, track_items: List[Any]) -> QMenu:
         """
@@ -71,7 +111,12 @@ class TrackItemContextMenu(QObject):
         Returns:
             QMenu with appropriate actions
         """
+        # The previous menu owns its submenus and actions (whose slots hold the
+        # items); free it so they don't accumulate across right-clicks
+        if self._last_menu is not None:
+            self._last_menu.deleteLater()
         menu = QMenu()
+        self._last_menu = menu
         
         if not track_items:
             action = menu.addAction("No items selected")
@@ -81,13 +126,12 @@ class TrackItemContextMenu(QObject):
         single_item = len(track_items) == 1
         item = track_items[0] if single_item else None
         
-        # Version submenu
+        # Submenus are filled when first opened, so the menu itself shows at once
         version_menu = menu.addMenu("Switch Version")
-        self._build_version_menu(version_menu, track_items)
+        self._populate_on_show(version_menu, self._build_version_menu, track_items)
         
-        # Department submenu
         dept_menu = menu.addMenu("Switch Department")
-        self._build_department_menu(dept_menu, track_items)
+        self._populate_on_show(dept_menu, self._build_department_menu, track_items)
         
         menu.addSeparator()
         
@@ -115,6 +159,17 @@ class TrackItemContextMenu(QObject):
         
         return menu
     
+    @staticmethod
+    def _populate_on_show(
+        menu: QMenu, build: Callable[[QMenu, List[Any]], None], items: List[Any]
+    ) -> None:
+        """Run build(menu, items) the first time the submenu is about to show."""
+        def populate():
+            # Builders always add at least one action, so a filled menu is never empty
+            if menu.isEmpty():
+                build(menu, items)
+        menu.aboutToShow.connect(populate)
+    
     def _build_version_menu(self, menu: QMenu, items: List[Any]) -> None:
         """Build version selection submenu."""
         # Get available versions for first item
@@ -126,40 +181,105 @@ class TrackItemContextMenu(QObject):
             return
         
         for version in versions[-10:]:  # Last 10 versions
-            action = menu.addAction(version)
-            action.triggered.connect(
-                lambda checked, v=version: self._switch_version(items, v)
-            )
+            menu.addAction(version).setData(version)
+        # One connection for the submenu; the chosen version rides on the action
+        menu.triggered.connect(
+            lambda action: self._switch_version(items, action.data())
+        )
     
     def _build_department_menu(self, menu: QMenu, items: List[Any]) -> None:
         """Build department selection submenu."""
-        departments = ['comp', 'light', 'anim', 'fx']
-        
         current_dept = None
-        if self._dept_switcher:
-            current_dept = self._dept_switcher.get_current_department(items[0])
+        dept_switcher = self.department_switcher
+        if dept_switcher:
+            try:
+                path = self._get_item_path_name(items[0])[0]
+            except (IndexError, AttributeError):
+                path = None
+            if path:
+                current_dept = dept_switcher.department_from_path(path)
         
-        for dept in departments:
+        for dept in self._DEPARTMENTS:
             action = menu.addAction(dept)
             action.setCheckable(True)
             action.setChecked(dept == current_dept)
-            action.triggered.connect(
-                lambda checked, d=dept: self._switch_department(items, d)
-            )
+            action.setData(dept)
+        menu.triggered.connect(
+            lambda action: self._switch_department(items, action.data())
+        )
+    
+    def _get_item_path_name(self, item: Any) -> Tuple[str, str]:
+        """
+        Get a track item's source path and name, walking its source once.
+        
+        Not cached: Hiero hands out a new wrapper for the same item on each
+        selection, so a per-item cache would never be hit.
+        """
+        if HIERO_AVAILABLE:
+            source = item.source()
+            path = source.mediaSource().fileinfos()[0].filename()
+            name = source.name()
+        else:
+            path = item.clip._path if hasattr(item, 'clip') else ""
+            name = "Mock Item"
+        return path, name
     
     def _get_available_versions(self, item: Any) -> List[str]:
-        """Get available versions for a track item."""
-        # This would need to look up versions based on item's source path
-        # For now, return placeholder
-        return ['v001', 'v002', 'v003', 'v004', 'v005']
+        """
+        Get available versions for a track item, oldest first.
+        
+        Versions are listed from the department folder behind the item's
+        source path and cached until the folders the scan reads change
+        (see department_stamp_paths), so reopening menus does not rescan.
+        """
+        if not self._scanner:
+            return []
+        try:
+            path = self._get_item_path_name(item)[0]
+        except (IndexError, AttributeError):
+            return []
+        if not path:
+            return []
+        parts = parse_shot_path(path)
+        ep, seq, shot, dept = parts['ep'], parts['seq'], parts['shot'], parts['dept']
+        if not (ep and seq and shot and dept):
+            return []
+        
+        dept_dir = os.path.join(str(self._scanner.project_root), ep, seq, shot, dept)
+        cached = self._version_cache.get(dept_dir)
+        if cached is not None and folder_stamp(*cached[0]) == cached[1]:
+            return cached[2]
+        
+        # Stamp before listing, so a change during the scan is seen next time
+        paths = department_stamp_paths(dept_dir)
+        stamp = folder_stamp(*paths)
+        versions = self._scanner.scan_versions(ep, seq, shot, dept, use_cache=False)
+        if versions:
+            latest_path = department_stamp_paths(dept_dir, versions[-1])[-1]
+            paths += (latest_path,)
+            stamp += folder_stamp(latest_path)
+        self._version_cache[dept_dir] = (paths, stamp, versions)
+        return versions
     
-    def _switch_version(self, items: List[Any], version: str) -> None:
-        """Switch selected items to specified version."""
-        if not self._version_updater:
+    def _bulk_update(
+        self, items: List[Any], new_version_for: Callable[[Any, Optional[str]], Optional[str]]
+    ) -> None:
+        """
+        Update items to per-item versions as one undo step.
+        
+        new_version_for(item, current_version) returns the target version,
+        or None to leave the item alone.
+        """
+        updater = self.version_updater
+        if not updater or not items:
             return
 
-        for item in items:
-            self._version_updater.update_shot_version(item, version)
+        with HieroTimeline.batched_edit(items[0], "Bulk version change"):
+            updater.update_items(items, new_version_for)
+
+    def _switch_version(self, items: List[Any], version: str) -> None:
+        """Switch selected items to specified version."""
+        self._bulk_update(items, lambda item, current: version)
 
     def _switch_department(self, items: List[Any], department: str) -> None:
         """Switch selected items to specified department."""
@@ -168,62 +288,43 @@ class TrackItemContextMenu(QObject):
 
     def _go_previous_version(self, items: List[Any]) -> None:
         """Go to previous version for all items."""
-        if not self._version_updater:
-            return
-
-        for item in items:
-            current = self._version_updater.get_item_current_version(item)
-            if current:
-                prev_ver = VersionManager.decrement_version(current)
-                if prev_ver:
-                    self._version_updater.update_shot_version(item, prev_ver)
+        self._bulk_update(
+            items,
+            lambda item, current: VersionManager.decrement_version(current) if current else None
+        )
 
     def _go_next_version(self, items: List[Any]) -> None:
         """Go to next version for all items."""
-        if not self._version_updater:
-            return
-
-        for item in items:
-            current = self._version_updater.get_item_current_version(item)
-            if current:
-                next_ver = VersionManager.increment_version(current)
-                self._version_updater.update_shot_version(item, next_ver)
+        self._bulk_update(
+            items,
+            lambda item, current: VersionManager.increment_version(current) if current else None
+        )
 
     def _go_latest_version(self, items: List[Any]) -> None:
         """Go to latest version for all items."""
-        if not self._version_updater:
-            return
-
-        for item in items:
-            versions = self._get_available_versions(item)
-            if versions:
-                latest = VersionManager.get_latest_version(versions)
-                self._version_updater.update_shot_version(item, latest)
+        self._bulk_update(
+            items,
+            lambda item, current: VersionManager.get_latest_version(self._get_available_versions(item))
+        )
 
     def _show_in_explorer(self, item: Any) -> None:
         """Open file location in system file explorer."""
         try:
-            if HIERO_AVAILABLE:
-                source = item.source()
-                path = source.mediaSource().fileinfos()[0].filename()
-            else:
-                path = item.clip._path if hasattr(item, 'clip') else ""
+            path = self._get_item_path_name(item)[0]
 
             if not path:
                 return
 
             # Get directory
-            import os
             directory = os.path.dirname(path)
 
-            # Open in explorer based on platform
-            system = platform.system()
-            if system == "Windows":
-                subprocess.run(['explorer', '/select,', path])
-            elif system == "Darwin":  # macOS
-                subprocess.run(['open', '-R', path])
-            else:  # Linux
-                subprocess.run(['xdg-open', directory])
+            # Open in explorer based on platform; don't wait for the
+            # file browser, so the UI thread returns immediately
+            subprocess.Popen(
+                _explorer_command(path, directory),
+                close_fds=True,
+                creationflags=getattr(subprocess, 'DETACHED_PROCESS', 0)
+            )
 
         except Exception as e:
             print(f"[ContextMenu] Failed to open explorer: {e}")
@@ -231,13 +332,7 @@ class TrackItemContextMenu(QObject):
     def _show_properties(self, item: Any) -> None:
         """Show properties dialog for item."""
         try:
-            if HIERO_AVAILABLE:
-                source = item.source()
-                path = source.mediaSource().fileinfos()[0].filename()
-                name = source.name()
-            else:
-                path = item.clip._path if hasattr(item, 'clip') else ""
-                name = "Mock Item"
+            path, name = self._get_item_path_name(item)
 
             version = VersionManager.parse_version(path) if path else None
 
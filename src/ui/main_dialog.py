@@ -3,6 +3,7 @@ Main Dialog UI Module
 ======================
 Main Qt-based dialog window for the Hiero Review Tool.
 """
+from datetime import datetime
 from typing import Optional, Callable, List
 
 # Try to import PySide2 (Hiero's Qt), fallback to PySide6 for testing
@@ -14,7 +15,7 @@ try:
         QProgressBar, QTextEdit, QGroupBox, QSplitter, QFileDialog,
         QMessageBox, QApplication, QWidget,
     )
-    from PySide2.QtCore import Qt, Signal, QThread
+    from PySide2.QtCore import Qt, Signal, QThread, QObject, QRunnable, QThreadPool
     from PySide2.QtGui import QFont
 except ImportError:
     try:
@@ -25,15 +26,59 @@ except ImportError:
             QProgressBar, QTextEdit, QGroupBox, QSplitter, QFileDialog,
             QMessageBox, QApplication, QWidget,
         )
-        from PySide6.QtCore import Qt, Signal, QThread
+        from PySide6.QtCore import Qt, Signal, QThread, QObject, QRunnable, QThreadPool
         from PySide6.QtGui import QFont
     except ImportError:
         # Define minimal stubs for testing without Qt
         class QDialog:
             pass
+        class QObject:
+            pass
+        class QRunnable:
+            pass
+        class QThreadPool:
+            pass
+        class QWidget:
+            pass
+        class QGroupBox:
+            pass
+        class QHBoxLayout:
+            pass
         class Signal:
             def __init__(self, *args): pass
 
+from ..config import list_available_projects, load_project_configs
+
+
+class _ProjectLoaderSignals(QObject):
+    """Signals for ProjectLoader; QRunnable itself cannot emit."""
+    loaded = Signal(list, dict)  # Project names, {name: ProjectConfig}
+    failed = Signal(str)  # Error message
+
+
+class ProjectLoader(QRunnable):
+    """
+    Lists and loads the available project configs on a worker thread.
+    
+    Reading the config directory can stall on network home folders, so
+    it is kept off the UI thread; results arrive through queued signals.
+    The config files themselves are read concurrently.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = _ProjectLoaderSignals()
+    
+    def run(self) -> None:
+        # Report any failure; an exception escaping a QRunnable is lost
+        try:
+            projects = list_available_projects()
+            configs = load_project_configs(projects)
+        except Exception as e:
+            self.signals.failed.emit(f"Failed to load projects: {e}")
+            return
+        self.signals.loaded.emit(projects, configs)
+
 
 class ReviewToolDialog(QDialog):
     """
@@ -57,10 +102,22 @@ class ReviewToolDialog(QDialog):
         self.setMinimumSize(600, 700)
         self.resize(700, 800)
         
+        self._loader_signals: Optional[_ProjectLoaderSignals] = None
+        self._project_configs: dict = {}
+        # Project configs are first read when the dialog is shown (showEvent)
+        self._projects_requested = False
+        
         self._setup_ui()
         self._connect_signals()
         self._apply_style()
     
+    def showEvent(self, event) -> None:
+        """Start the first project load when the dialog is first shown."""
+        super().showEvent(event)
+        if not self._projects_requested:
+            self._projects_requested = True
+            self.load_projects_async()
+    
     def _setup_ui(self) -> None:
         """Set up the main UI layout."""
         main_layout = QVBoxLayout(self)
@@ -266,6 +323,8 @@ class ReviewToolDialog(QDialog):
 
     def _connect_signals(self) -> None:
         """Connect UI signals to slots."""
+        self.refresh_projects_btn.clicked.connect(self.load_projects_async)
+        self.project_combo.currentTextChanged.connect(self._on_project_changed)
         self.browse_btn.clicked.connect(self._on_browse)
         self.select_all_btn.clicked.connect(self._select_all_sequences)
         self.deselect_all_btn.clicked.connect(self._deselect_all_sequences)
@@ -326,6 +385,12 @@ class ReviewToolDialog(QDialog):
             self.root_path_edit.setText(path)
             self.log_message(f"Root changed to: {path}")
 
+    def _on_project_changed(self, name: str) -> None:
+        """Show the selected project's root, if its config has been loaded."""
+        config = self._project_configs.get(name)
+        if config is not None:
+            self.root_path_edit.setText(config.project_root)
+
     def _select_all_sequences(self) -> None:
         """Select all sequences in list."""
         for i in range(self.sequence_list.count()):
@@ -374,9 +439,33 @@ class ReviewToolDialog(QDialog):
         }
 
     def set_projects(self, projects: List[str]) -> None:
-        """Populate project dropdown."""
+        """Populate project dropdown, keeping the current project if still listed."""
+        current = self.project_combo.currentText()
+        
+        # Repopulate quietly, then report the resulting project once
+        self.project_combo.blockSignals(True)
         self.project_combo.clear()
         self.project_combo.addItems(projects)
+        index = self.project_combo.findText(current)
+        if index >= 0:
+            self.project_combo.setCurrentIndex(index)
+        self.project_combo.blockSignals(False)
+        self._on_project_changed(self.project_combo.currentText())
+
+    def _on_projects_loaded(self, projects: List[str], configs: dict) -> None:
+        """Store configs loaded by ProjectLoader, then list the projects."""
+        # Set before populating, since filling the dropdown selects a project
+        self._project_configs = configs
+        self.set_projects(projects)
+
+    def load_projects_async(self) -> None:
+        """List project configs on the global thread pool, then populate the dropdown."""
+        loader = ProjectLoader()
+        loader.signals.loaded.connect(self._on_projects_loaded)
+        loader.signals.failed.connect(lambda message: self.log_message(message, "error"))
+        # The pool deletes the runnable when done; keep its signals alive until they emit
+        self._loader_signals = loader.signals
+        QThreadPool.globalInstance().start(loader)
 
     def set_episodes(self, episodes: List[str]) -> None:
         """Populate episode dropdown."""
@@ -409,7 +498,6 @@ class ReviewToolDialog(QDialog):
         """Add message to status log."""
         colors = {"info": "#e0e0e0", "warning": "#ffd700", "error": "#ff6b6b"}
         color = colors.get(level, colors["info"])
-        from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.log_text.append(f'<span style="color:{color}">[{timestamp}] {message}</span>')
 
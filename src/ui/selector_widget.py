@@ -31,6 +31,7 @@ from ..core import ProjectScanner
 
 class ScanWorker(QThread):
     """Background worker for scanning operations."""
+    item_found = Signal(str)  # Episode scans only, as each one is found
     finished = Signal(list)
     error = Signal(str)
     
@@ -43,7 +44,11 @@ class ScanWorker(QThread):
     def run(self):
         try:
             if self._scan_type == "episodes":
-                result = self._scanner.scan_episodes()
+                result = []
+                for episode in self._scanner.iter_episodes():
+                    result.append(episode)
+                    self.item_found.emit(episode)
+                result.sort()
             elif self._scan_type == "sequences":
                 result = self._scanner.scan_sequences(self._kwargs.get('episode', ''))
             elif self._scan_type == "shots":
@@ -68,6 +73,8 @@ class EpisodeSelector(QWidget):
         super().__init__(parent)
         self._scanner = scanner
         self._worker: Optional[ScanWorker] = None
+        # Last episode announced through episode_changed
+        self._episode = ""
         self._setup_ui()
     
     def _setup_ui(self):
@@ -104,28 +111,57 @@ class EpisodeSelector(QWidget):
         self.combo.setEnabled(False)
         
         self._worker = ScanWorker(self._scanner, "episodes")
+        self._worker.item_found.connect(self._on_episode_found)
         self._worker.finished.connect(self._on_scan_finished)
         self._worker.error.connect(self._on_scan_error)
         self._worker.start()
     
+    def _on_episode_found(self, episode: str) -> None:
+        # Show new episodes as they arrive without selecting any (adding to
+        # an empty combo would select the first found); the sorted list
+        # replaces them on finish and the selection is settled there
+        if self.combo.findText(episode) < 0:
+            blocked = self.combo.blockSignals(True)
+            index = self.combo.currentIndex()
+            self.combo.addItem(episode)
+            self.combo.setCurrentIndex(index)
+            self.combo.blockSignals(blocked)
+    
     def _on_scan_finished(self, episodes: List[str]) -> None:
         self.loading_label.setVisible(False)
         self.combo.setEnabled(True)
         
+        self._replace_episodes(episodes)
+    
+    def _replace_episodes(self, episodes: List[str]) -> None:
+        """
+        Repopulate the combo, announcing the episode once if it changed.
+        
+        Keeps the current episode if it is still listed, otherwise selects
+        the first one.
+        """
         current = self.combo.currentText()
+        
+        self.combo.blockSignals(True)
         self.combo.clear()
         self.combo.addItems(episodes)
         
         # Restore selection if possible
         idx = self.combo.findText(current)
-        if idx >= 0:
-            self.combo.setCurrentIndex(idx)
+        self.combo.setCurrentIndex(idx if idx >= 0 else (0 if episodes else -1))
+        self.combo.blockSignals(False)
+        
+        # Compare with the last announced episode, not the combo's previous
+        # text, so nothing selected in between can swallow the signal
+        if self.combo.currentText() != self._episode:
+            self._on_episode_changed(self.combo.currentText())
     
     def _on_scan_error(self, error: str) -> None:
         self.loading_label.setVisible(False)
         self.combo.setEnabled(True)
     
     def _on_episode_changed(self, episode: str) -> None:
+        self._episode = episode
         self.episode_changed.emit(episode)
     
     def current_episode(self) -> str:
@@ -133,8 +169,7 @@ class EpisodeSelector(QWidget):
     
     def set_episodes(self, episodes: List[str]) -> None:
         """Manually set episodes list."""
-        self.combo.clear()
-        self.combo.addItems(episodes)
+        self._replace_episodes(episodes)
 
 
 class SequenceSelector(QWidget):
@@ -222,10 +257,16 @@ class SequenceSelector(QWidget):
 
     def _populate_list(self, sequences: List[str]) -> None:
         """Populate the list widget."""
+        had_selection = bool(self.list_widget.selectedItems())
+
+        self.list_widget.blockSignals(True)
         self.list_widget.clear()
-        for seq in sequences:
-            item = QListWidgetItem(seq)
-            self.list_widget.addItem(item)
+        self.list_widget.addItems(sequences)
+        self.list_widget.blockSignals(False)
+
+        # Clearing drops the selection; report that once
+        if had_selection:
+            self._on_selection_changed()
 
     def _apply_filter(self, text: str) -> None:
         """Filter sequences by text."""
@@ -239,8 +280,12 @@ class SequenceSelector(QWidget):
 
     def select_all(self) -> None:
         """Select all visible sequences."""
+        # One selection_changed for the whole batch rather than one per item
+        self.list_widget.blockSignals(True)
         for i in range(self.list_widget.count()):
             self.list_widget.item(i).setSelected(True)
+        self.list_widget.blockSignals(False)
+        self._on_selection_changed()
 
     def deselect_all(self) -> None:
         """Deselect all sequences."""
@@ -5,6 +5,8 @@ Utility functions for parsing project file paths and extracting metadata.
 """
 import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 
@@ -139,14 +141,19 @@ def parse_version_from_filename(filename: str) -> Optional[str]:
     """
     match = _VERSION_RE.search(filename)
     if match:
-        return f"v{match.group(1)}"
+        # Interned: the same few versions recur across every shot's scan data
+        return sys.intern(f"v{match.group(1)}")
     return None
 
 
+@lru_cache(maxsize=8192)
 def parse_frame_number(filename: str) -> Optional[int]:
     """
     Extract frame number from image sequence filename.
     
+    Results are memoized since timeline builds validate the same
+    file lists repeatedly.
+    
     Args:
         filename: Filename string
         
@@ -173,11 +180,7 @@ def get_frame_range(files: List[str]) -> Optional[Tuple[int, int]]:
     Returns:
         Tuple of (start_frame, end_frame) or None
     """
-    frames = []
-    for f in files:
-        frame = parse_frame_number(f)
-        if frame is not None:
-            frames.append(frame)
+    frames = [fn for f in files if (fn := parse_frame_number(f)) is not None]
     
     if frames:
         return (min(frames), max(frames))
@@ -90,11 +90,7 @@ def validate_frame_sequence(files: List[str]) -> Dict[str, any]:
     Returns:
         Dict with 'complete', 'missing_frames', 'frame_range'
     """
-    frames = []
-    for f in files:
-        frame = parse_frame_number(f)
-        if frame is not None:
-            frames.append(frame)
+    frames = [fn for f in files if (fn := parse_frame_number(f)) is not None]
     
     if not frames:
         return {'complete': False, 'missing_frames': [], 'frame_range': None}
@@ -0,0 +1,12 @@
+import pytest
+
+from src.core.hiero_wrapper import HieroProject
+
+
+@pytest.fixture(autouse=True)
+def fresh_mock_project():
+    # Outside Hiero, sequences live in one shared mock project; start and
+    # leave every test without any
+    HieroProject.reset_mock_project()
+    yield
+    HieroProject.reset_mock_project()
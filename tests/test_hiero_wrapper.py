@@ -0,0 +1,323 @@
+"""
+Tests for the Hiero wrapper: add_av_pair, get_source_path, bins and
+get_sequence_by_name.
+
+The Hiero code path runs against small fakes of the Hiero track and
+sequence API; the mock path against the module's Mock classes.
+"""
+import pytest
+
+from src.core import hiero_wrapper
+from src.core.hiero_wrapper import (
+    HieroClip, HieroProject, HieroTimeline, HieroTrackItem, MockClip, MockTrack
+)
+
+
+class FakeItem:
+    def __init__(self, track, timeline_in):
+        self._track = track
+        self._in = timeline_in
+
+    def parent(self):
+        # A fresh wrapper per call, as Hiero returns
+        return self._track.wrapper()
+
+    def timelineIn(self):
+        return self._in
+
+
+class FakeTrack:
+    """One underlying track; wrapper() gives a new, equal Python object."""
+    def __init__(self, name, sequence, state=None):
+        self._name = name
+        self._sequence = sequence
+        self._state = state if state is not None else {"items": [], "add_item_calls": 0}
+
+    def wrapper(self):
+        return FakeTrack(self._name, self._sequence, self._state)
+
+    def __eq__(self, other):
+        return isinstance(other, FakeTrack) and other._state is self._state
+
+    def name(self):
+        return self._name
+
+    def parent(self):
+        return self._sequence
+
+    def items(self):
+        return tuple(self._state["items"])
+
+    def addItem(self, clip, timeline_in):
+        self._state["add_item_calls"] += 1
+        item = FakeItem(self, timeline_in)
+        self._state["items"].append(item)
+        return item
+
+
+class FakeSequence:
+    def __init__(self, returns="list"):
+        self.returns = returns
+        self.add_clip_calls = 0
+        self.video = FakeTrack("Video", self)
+        self.audio = FakeTrack("Audio", self)
+
+    def videoTracks(self):
+        return [self.video.wrapper()]
+
+    def audioTracks(self):
+        return [self.audio.wrapper()]
+
+    def addClip(self, clip, timeline_in, video_index, audio_index):
+        self.add_clip_calls += 1
+        assert (video_index, audio_index) == (0, 0)
+        items = []
+        for track in (self.video, self.audio):
+            item = FakeItem(track, timeline_in)
+            track._state["items"].append(item)
+            items.append(item)
+        if self.returns == "list":
+            return items
+        if self.returns == "video":
+            return items[0]
+        if self.returns == "error":
+            raise RuntimeError("late failure")
+        return None
+
+
+@pytest.fixture
+def in_hiero(monkeypatch):
+    monkeypatch.setattr(hiero_wrapper, "HIERO_AVAILABLE", True)
+
+
+def add_pair(sequence):
+    # Tracks as a caller holds them: wrappers distinct from the sequence's own
+    return HieroTrackItem.add_av_pair(
+        sequence.video.wrapper(), sequence.audio.wrapper(), MockClip("/a.mov"), 10, 20
+    )
+
+
+@pytest.mark.parametrize("returns", ["list", "video", "none"])
+def test_add_clip_items_are_matched_without_duplicates(in_hiero, returns):
+    sequence = FakeSequence(returns)
+
+    video_item, audio_item = add_pair(sequence)
+
+    assert sequence.add_clip_calls == 1
+    assert [len(t.items()) for t in (sequence.video, sequence.audio)] == [1, 1]
+    assert video_item is sequence.video.items()[0]
+    assert audio_item is sequence.audio.items()[0]
+
+
+def test_late_add_clip_error_is_not_retried_per_track(in_hiero):
+    sequence = FakeSequence("error")
+
+    with pytest.raises(RuntimeError):
+        add_pair(sequence)
+
+    assert sequence.video._state["add_item_calls"] == 0
+    assert sequence.audio._state["add_item_calls"] == 0
+
+
+def test_falls_back_to_per_track_adds_when_tracks_are_not_in_sequence(in_hiero):
+    sequence = FakeSequence()
+    stray_audio = FakeTrack("Other", sequence)
+
+    video_item, audio_item = HieroTrackItem.add_av_pair(
+        sequence.video.wrapper(), stray_audio, MockClip("/a.mov"), 10, 20
+    )
+
+    assert sequence.add_clip_calls == 0
+    assert video_item is sequence.video.items()[0]
+    assert audio_item is stray_audio.items()[0]
+
+
+def test_mock_mode_places_one_item_per_track(monkeypatch):
+    monkeypatch.setattr(hiero_wrapper, "HIERO_AVAILABLE", False)
+    video, audio = MockTrack("Video", "video"), MockTrack("Audio", "audio")
+
+    video_item, audio_item = HieroTrackItem.add_av_pair(video, audio, MockClip("/a.mov"), 10, 20)
+
+    assert video.items() == [video_item]
+    assert audio.items() == [audio_item]
+    assert (video_item.timelineIn(), video_item.timelineOut()) == (10, 20)
+
+
+# get_sequence_by_name
+
+class FakeSeq:
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class FakeBinItem:
+    def __init__(self, seq, parent):
+        self._seq = seq
+        self._parent = parent
+
+    def activeItem(self):
+        return self._seq
+
+    def parentBin(self):
+        return self._parent
+
+
+class FakeBin:
+    def __init__(self):
+        self._items = []
+        self.walks = 0
+
+    def add(self, seq):
+        self._items.append(FakeBinItem(seq, self))
+        return seq
+
+    def remove(self, seq):
+        item = next(i for i in self._items if i._seq is seq)
+        self._items.remove(item)
+        item._parent = None
+
+    def items(self):
+        self.walks += 1
+        return list(self._items)
+
+
+class FakeProject:
+    def __init__(self):
+        self.bin = FakeBin()
+
+    def clipsBin(self):
+        return self.bin
+
+
+@pytest.fixture
+def project(in_hiero, monkeypatch):
+    project = FakeProject()
+    monkeypatch.setattr(hiero_wrapper, "_Sequence", FakeSeq, raising=False)
+    monkeypatch.setattr(hiero_wrapper.HieroProject, "get_active_project", staticmethod(lambda: project))
+    return project
+
+
+def test_sequence_lookups_reuse_the_index(project):
+    review = project.bin.add(FakeSeq("review"))
+    project.bin.add(FakeSeq("other"))
+
+    assert HieroTimeline.get_sequence_by_name("review") is review
+    assert HieroTimeline.get_sequence_by_name("other") is not None
+    assert HieroTimeline.get_sequence_by_name("review") is review
+    assert project.bin.walks == 1
+
+
+def test_renamed_sequence_is_not_served_from_the_index(project):
+    review = project.bin.add(FakeSeq("review"))
+    assert HieroTimeline.get_sequence_by_name("review") is review
+
+    review._name = "review_old"
+    replacement = project.bin.add(FakeSeq("review"))
+
+    assert HieroTimeline.get_sequence_by_name("review") is replacement
+
+
+def test_deleted_sequence_is_not_served_from_the_index(project):
+    review = project.bin.add(FakeSeq("review"))
+    assert HieroTimeline.get_sequence_by_name("review") is review
+
+    project.bin.remove(review)
+
+    assert HieroTimeline.get_sequence_by_name("review") is None
+
+
+def test_sequence_created_after_indexing_is_found(project):
+    project.bin.add(FakeSeq("other"))
+    assert HieroTimeline.get_sequence_by_name("review") is None
+
+    review = project.bin.add(FakeSeq("review"))
+
+    assert HieroTimeline.get_sequence_by_name("review") is review
+
+
+def test_source_path_of_a_deleted_item_is_none(in_hiero):
+    class DeadItem:
+        def source(self):
+            raise RuntimeError("Internal C++ object already deleted.")
+
+    assert HieroTrackItem.get_source_path(DeadItem()) is None
+
+
+# Bins
+
+class FakeHieroBin:
+    def __init__(self, name):
+        self._name = name
+        self._bins = []
+        self._items = []
+
+    def name(self):
+        return self._name
+
+    def bins(self):
+        return list(self._bins)
+
+    def items(self):
+        return list(self._items)
+
+    def addItem(self, item):
+        (self._bins if isinstance(item, FakeHieroBin) else self._items).append(item)
+        return item
+
+
+class FakeClip:
+    def __init__(self, path):
+        self._path = path
+
+    def mediaSource(self):
+        path = self._path
+
+        class Info:
+            def filename(self):
+                return path
+
+        class Source:
+            def fileinfos(self):
+                return [Info()]
+
+        return Source()
+
+
+class FakeClipItem:
+    def __init__(self, clip):
+        self._clip = clip
+
+    def activeItem(self):
+        return self._clip
+
+
+@pytest.fixture
+def bin_project(in_hiero, monkeypatch):
+    project = FakeProject()
+    project.bin = FakeHieroBin("Clips")
+    monkeypatch.setattr(hiero_wrapper, "_Bin", FakeHieroBin, raising=False)
+    monkeypatch.setattr(hiero_wrapper, "_Clip", FakeClip, raising=False)
+    return project
+
+
+def test_bin_paths_resolve_to_nested_bins(bin_project):
+    sq10 = HieroProject.get_or_create_bin("Ep01/sq0010", bin_project)
+    sq20 = HieroProject.get_or_create_bin("Ep01/sq0020", bin_project)
+
+    (ep01,) = bin_project.bin.bins()
+    assert ep01.name() == "Ep01"
+    assert ep01.bins() == [sq10, sq20]
+    assert sq10.name() == "sq0010"
+    assert HieroProject.get_or_create_bin("Ep01/sq0010", bin_project) is sq10
+
+
+def test_index_bin_clips_reads_nested_bins(bin_project):
+    clip = FakeClip("/a.mov")
+    HieroProject.get_or_create_bin("Ep01/sq0010", bin_project).addItem(FakeClipItem(clip))
+
+    index = HieroClip.index_bin_clips(["Ep01/sq0010", "Ep01/sq0020"], bin_project)
+
+    assert index == {("Ep01/sq0010", "/a.mov"): clip}
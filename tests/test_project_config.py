@@ -0,0 +1,51 @@
+"""
+Tests for loading project configs.
+"""
+import json
+
+import pytest
+
+from src.config import project_config
+from src.config.project_config import (
+    ConfigValidationError, load_project_config, load_project_configs
+)
+
+
+VALID = {
+    "project_name": "Show",
+    "project_root": "/projects/show",
+    "media_paths": {"import_dir": "/projects/show/import"},
+}
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(project_config, "get_config_dir", lambda: tmp_path)
+    return tmp_path
+
+
+def write(config_dir, name, content):
+    (config_dir / f"{name}.json").write_text(
+        content if isinstance(content, str) else json.dumps(content)
+    )
+
+
+@pytest.mark.parametrize("content", [[], "null", 3, "text"])
+def test_non_object_config_is_rejected(config_dir, content):
+    write(config_dir, "bad", json.dumps(content))
+
+    with pytest.raises(ConfigValidationError):
+        load_project_config("bad")
+
+
+def test_bad_configs_are_skipped_without_losing_the_good_ones(config_dir):
+    write(config_dir, "good", VALID)
+    write(config_dir, "array", [])
+    write(config_dir, "broken", "{not json")
+    write(config_dir, "invalid", {"project_name": "Nope"})
+    write(config_dir, "nested", dict(VALID, media_paths=[]))
+
+    configs = load_project_configs(["array", "good", "broken", "invalid", "nested"])
+
+    assert list(configs) == ["good"]
+    assert configs["good"].project_name == "Show"
@@ -0,0 +1,63 @@
+"""
+Tests for EpisodeSelector, driving its scan slots directly.
+"""
+import pytest
+
+try:
+    from PySide2.QtWidgets import QApplication
+except ImportError:
+    QApplication = pytest.importorskip("PySide6.QtWidgets").QApplication
+
+from src.ui.selector_widget import EpisodeSelector
+
+
+@pytest.fixture
+def selector():
+    app = QApplication.instance() or QApplication([])
+    widget = EpisodeSelector()
+    widget.announced = []
+    widget.episode_changed.connect(widget.announced.append)
+    yield widget
+    widget.deleteLater()
+
+
+def scan(selector, found, episodes):
+    """Deliver a scan's streamed episodes, then its sorted result."""
+    for episode in found:
+        selector._on_episode_found(episode)
+    selector._on_scan_finished(episodes)
+
+
+def test_streamed_episodes_select_nothing_until_the_scan_finishes(selector):
+    for episode in ["Ep02", "Ep01"]:
+        selector._on_episode_found(episode)
+
+    assert selector.current_episode() == ""
+    assert selector.announced == []
+
+
+def test_first_load_announces_the_first_sorted_episode(selector):
+    scan(selector, ["Ep02", "Ep01"], ["Ep01", "Ep02"])
+
+    assert selector.current_episode() == "Ep01"
+    assert selector.announced == ["Ep01"]
+
+
+def test_refresh_keeps_the_selected_episode_quietly(selector):
+    scan(selector, ["Ep01", "Ep02"], ["Ep01", "Ep02"])
+    selector.combo.setCurrentIndex(1)
+
+    scan(selector, ["Ep03", "Ep02", "Ep01"], ["Ep01", "Ep02", "Ep03"])
+
+    assert selector.current_episode() == "Ep02"
+    assert selector.announced == ["Ep01", "Ep02"]
+
+
+def test_refresh_without_the_selected_episode_announces_the_first(selector):
+    scan(selector, ["Ep01", "Ep02"], ["Ep01", "Ep02"])
+    selector.combo.setCurrentIndex(1)
+
+    scan(selector, ["Ep01"], ["Ep01"])
+
+    assert selector.current_episode() == "Ep01"
+    assert selector.announced == ["Ep01", "Ep02", "Ep01"]
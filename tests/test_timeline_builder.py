@@ -0,0 +1,201 @@
+"""
+Tests for TimelineBuilder, run against the Hiero mock classes.
+"""
+from pathlib import Path
+
+import pytest
+
+from src.core.cache_manager import CacheManager
+from src.core.file_scanner import ProjectScanner
+from src.core.hiero_wrapper import HIERO_AVAILABLE, HieroClip, HieroProject, HieroTrackItem
+from src.core.timeline_builder import TimelineBuilder, TimelineConfig
+
+pytestmark = pytest.mark.skipif(HIERO_AVAILABLE, reason="runs against the mock Hiero API")
+
+
+def make_shot(root: Path, shot: str, versions=("v001",), seq: str = "sq0010") -> Path:
+    """Create Ep01/<seq>/<shot>/comp with one MOV per version; return the dept folder."""
+    dept = root / "Ep01" / seq / shot / "comp"
+    (dept / "output").mkdir(parents=True, exist_ok=True)
+    for version in versions:
+        (dept / "output" / f"Ep01_{seq}_{shot}_{version}.mov").touch()
+    return dept
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    make_shot(root, "SH0010")
+    make_shot(root, "SH0020")
+    return root
+
+
+@pytest.fixture
+def builder(project, tmp_path):
+    # A real (enabled) scanner cache, so stale scanner results would show up
+    scanner = ProjectScanner(str(project), CacheManager(cache_dir=tmp_path / "cache"))
+    return TimelineBuilder(scanner)
+
+
+def config(name: str = "review", **kwargs) -> TimelineConfig:
+    kwargs.setdefault("sequences", ["sq0010"])
+    return TimelineConfig(name=name, episode="Ep01", department="comp", **kwargs)
+
+
+def laid_out_paths(result):
+    return [item.clip._path for item in result.sequence.videoTracks()[0].items()]
+
+
+def uncached_builder(root: Path) -> TimelineBuilder:
+    return TimelineBuilder(ProjectScanner(str(root), CacheManager(enabled=False)))
+
+
+def test_new_shot_on_disk_is_picked_up_by_next_build(project, builder):
+    assert builder.build_timeline(config("first")).shots_added == 2
+
+    make_shot(project, "SH0030")
+    result = builder.build_timeline(config("second"))
+
+    assert result.shots_found == 3
+    assert result.shots_added == 3
+    assert laid_out_paths(result)[-1].endswith("Ep01_sq0010_SH0030_v001.mov")
+
+
+# Update mode (TimelineConfig.update_existing)
+
+def test_update_without_existing_timeline_creates_it(project):
+    result = uncached_builder(project).build_timeline(config(update_existing=True))
+
+    assert result.success
+    assert result.shots_added == 2
+    assert HieroProject.get_active_project().clipsBin().items() == [result.sequence]
+
+
+def test_update_with_identical_data_touches_nothing(project):
+    builder = uncached_builder(project)
+    first = builder.build_timeline(config())
+
+    result = builder.build_timeline(config(update_existing=True))
+
+    assert result.success
+    assert result.sequence is first.sequence
+    assert (result.shots_added, result.shots_updated, result.shots_unchanged) == (0, 0, 2)
+    assert len(laid_out_paths(result)) == 2
+
+
+def test_update_counts_added_updated_and_unchanged_separately(project):
+    builder = uncached_builder(project)
+    first = builder.build_timeline(config())
+    end = first.sequence.videoTracks()[0].items()[-1].timelineOut()
+
+    make_shot(project, "SH0010", versions=("v002",))
+    make_shot(project, "SH0030")
+    result = builder.build_timeline(config(update_existing=True))
+
+    assert result.success and not result.errors
+    assert result.sequence is first.sequence
+    assert (result.shots_added, result.shots_updated, result.shots_unchanged) == (1, 1, 1)
+
+    items = result.sequence.videoTracks()[0].items()
+    assert len(items) == 3
+    sh10, sh20, sh30 = items
+    assert sh10.clip._path.endswith("SH0010_v002.mov")
+    assert HieroTrackItem.get_metadata(sh10, "version") == "v002"
+    assert sh20.clip._path.endswith("SH0020_v001.mov")
+    # New shots go after the existing cut
+    assert HieroTrackItem.get_metadata(sh30, "shot") == "Ep01_sq0010_SH0030"
+    assert sh30.timelineIn() == end + 1
+
+
+def test_failed_import_is_reported_and_added_by_a_later_update(project, monkeypatch):
+    builder = uncached_builder(project)
+    create = HieroClip.create_clips_batch
+    monkeypatch.setattr(HieroClip, "create_clips_batch", staticmethod(
+        lambda specs: [None if "SH0020" in spec[0] else clip
+                       for spec, clip in zip(specs, create(specs))]
+    ))
+
+    first = builder.build_timeline(config())
+
+    assert first.shots_added == 1
+    assert len(first.errors) == 1 and "SH0020" in first.errors[0]
+    assert first.shots_skipped == ["Ep01_sq0010_SH0020 (import failed)"]
+
+    monkeypatch.setattr(HieroClip, "create_clips_batch", create)
+    result = builder.build_timeline(config(update_existing=True))
+
+    assert (result.shots_added, result.shots_updated, result.shots_unchanged) == (1, 0, 1)
+    assert laid_out_paths(result)[-1].endswith("SH0020_v001.mov")
+
+
+# Shot detail cache
+
+def add_frames(dept: Path, version: str, frames) -> None:
+    folder = dept / "version" / version
+    folder.mkdir(parents=True, exist_ok=True)
+    for frame in frames:
+        (folder / f"{dept.parent.name}.{frame:04d}.exr").touch()
+
+
+def test_new_version_on_disk_is_picked_up_by_next_build(project, builder):
+    first = builder.build_timeline(config("first"))
+    assert laid_out_paths(first)[0].endswith("SH0010_v001.mov")
+
+    make_shot(project, "SH0010", versions=("v002",))
+    result = builder.build_timeline(config("second"))
+
+    assert laid_out_paths(result)[0].endswith("SH0010_v002.mov")
+    assert HieroTrackItem.get_metadata(result.sequence.videoTracks()[0].items()[0], "version") == "v002"
+
+
+def test_frames_added_to_a_version_folder_change_the_duration(project, builder):
+    dept = make_shot(project, "SH0010")
+    add_frames(dept, "v001", range(1001, 1004))
+    seq_config = dict(media_type="sequence", sequences=["sq0010"])
+
+    first = builder.build_timeline(config("first", **seq_config))
+    item = first.sequence.videoTracks()[0].items()[0]
+    assert item.timelineOut() - item.timelineIn() + 1 == 3
+
+    add_frames(dept, "v001", [1004, 1005])
+    result = builder.build_timeline(config("second", **seq_config))
+    item = result.sequence.videoTracks()[0].items()[0]
+    assert item.timelineOut() - item.timelineIn() + 1 == 5
+
+
+def test_unchanged_shots_are_not_rescanned(project, builder, monkeypatch):
+    builder.build_timeline(config("first"))
+
+    calls = []
+    scan = builder._scanner.scan_shot_detail
+    monkeypatch.setattr(
+        builder._scanner, "scan_shot_detail",
+        lambda *args: calls.append(args) or scan(*args)
+    )
+    make_shot(project, "SH0020", versions=("v002",))
+    builder.build_timeline(config("second"))
+
+    assert calls == [("Ep01", "sq0010", "SH0020")]
+
+
+def test_specific_version_uses_that_versions_mov(project, builder):
+    make_shot(project, "SH0010", versions=("v002",))
+
+    result = builder.build_timeline(config(version="v001"))
+    item = result.sequence.videoTracks()[0].items()[0]
+
+    assert item.clip._path.endswith("SH0010_v001.mov")
+    assert HieroTrackItem.get_metadata(item, "version") == "v001"
+
+
+def test_metadata_records_the_version_actually_laid_out(project, builder):
+    # v002 exists only as an image-sequence folder; v003 has a MOV
+    dept = make_shot(project, "SH0010", versions=("v003",))
+    add_frames(dept, "v002", range(1001, 1003))
+
+    result = builder.build_timeline(config(version="v002"))
+    item = result.sequence.videoTracks()[0].items()[0]
+
+    # No v002 MOV, so the latest MOV is used and recorded as such
+    assert item.clip._path.endswith("SH0010_v003.mov")
+    assert HieroTrackItem.get_metadata(item, "version") == "v003"